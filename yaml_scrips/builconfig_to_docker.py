@@ -1,14 +1,67 @@
+import sys
+
 import yaml
 
-# Read the YAML file
-with open('nv-tools-build.yml', 'r') as file:
-    buildconfig = yaml.safe_load(file)
+DOCKERFILE_PATH = ('spec', 'source', 'dockerfile')
+
+def extract_scalar(stream, path):
+    """
+    Walk the YAML event stream and return the scalar found at `path`
+    (a tuple of mapping keys), stopping as soon as it has been read.
+    Returns None if the path is not present.
+    """
+    # Only parser events are needed, so the base loader is enough: no tag
+    # resolution or type coercion. Prefer the libyaml-backed one.
+    Loader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+    keys = []     # mapping keys leading to the current node
+    frames = []   # one entry per open collection: [is_mapping, expecting_key]
+    anchors = {}  # anchored scalars, for resolving aliases to them
+    for event in yaml.parse(stream, Loader=Loader):
+        parent = frames[-1] if frames else None
+        if isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+            # An alias stands for a single node, so it is handled like a
+            # scalar; it resolves to None unless it refers to a scalar
+            if isinstance(event, yaml.ScalarEvent):
+                value = event.value
+                if event.anchor is not None:
+                    anchors[event.anchor] = value
+            else:
+                value = anchors.get(event.anchor)
+            if parent is None or not parent[0]:
+                continue
+            if parent[1]:
+                keys.append(value)
+                parent[1] = False
+            elif tuple(keys) == path:
+                return value
+            else:
+                keys.pop()
+                parent[1] = True
+        elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            if parent is not None and not parent[0]:
+                keys.append(None)  # sequence item
+            frames.append([isinstance(event, yaml.MappingStartEvent), True])
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            frames.pop()
+            if frames:
+                keys.pop()
+                frames[-1][1] = True
+    return None
+
+def main():
+    # Read the YAML file in one go and pull out only the Dockerfile content
+    with open('nv-tools-build.yml', 'rb') as file:
+        raw = file.read()
+    dockerfile_content = extract_scalar(raw, DOCKERFILE_PATH)
+    if dockerfile_content is None:
+        print("Error: no spec.source.dockerfile found in nv-tools-build.yml")
+        sys.exit(1)
 
-# Extract the Dockerfile content
-dockerfile_content = buildconfig['spec']['source']['dockerfile']
+    # Write it to a Dockerfile as a single pre-encoded buffer
+    with open('Dockerfile_nvidia_tools', 'wb') as dockerfile:
+        dockerfile.write(dockerfile_content.encode('utf-8'))
 
-# Write it to a Dockerfile
-with open('Dockerfile_nvidia_tools', 'w') as dockerfile:
-    dockerfile.write(dockerfile_content)
+    print("Dockerfile extracted successfully!")
 
-print("Dockerfile extracted successfully!")
+if __name__ == "__main__":
+    main()
@@ -2,33 +2,37 @@ import subprocess
 import shutil
 import json
 
+from oc_cache import CHECK_KINDS, fetch_many
+
 def check_oc_installed():
     """Verify that the oc CLI is installed and available."""
     if shutil.which("oc") is None:
         print("Error: 'oc' command not found. Please install the OpenShift CLI (oc).")
         return False
-        return True
+    return True
 
 def check_node_feature_discovery():
     """Check if NodeFeatureDiscovery is installed in the openshift-nfd namespace."""
     if not check_oc_installed():
-        return
+        return False
     
+    # NodeFeatureDiscovery is fetched together with the other kinds the checker scripts need
     try:
-        # Run the oc command to get NodeFeatureDiscovery resource in the specified namespace
-        result = subprocess.run(
-            ["oc", "get", "NodeFeatureDiscovery", "-n", "openshift-nfd"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True
-        )
-        print("NodeFeatureDiscovery is installed in the 'openshift-nfd' namespace:")
-        print(result.stdout)
+        items = fetch_many(CHECK_KINDS).get("NodeFeatureDiscovery", [])
     except subprocess.CalledProcessError as e:
         print("NodeFeatureDiscovery is not installed or the oc command failed:")
-        print(e.stderr)
+        print(e.stderr.decode("utf-8"))
+        return False
+
+    names = [item["metadata"]["name"] for item in items
+             if item["metadata"].get("namespace") == "openshift-nfd"]
+    if not names:
+        print("NodeFeatureDiscovery is not installed in the 'openshift-nfd' namespace.")
+        return False
+    print("NodeFeatureDiscovery is installed in the 'openshift-nfd' namespace:")
+    print("\n".join(names))
+    return True
 
-        #if __name__ == "__main__":
-        check_node_feature_discovery()
+if __name__ == "__main__":
+    check_node_feature_discovery()
 
@@ -1,14 +1,46 @@
 import subprocess
+import sys
 
-# Run the OpenShift command to get nodes with labels
-try:
-    data = subprocess.check_output(["oc", "get", "nodes", "--show-labels"]).decode("utf-8")
-except subprocess.CalledProcessError as e:
-    print("Error executing oc command:", e)
-    data = ""
+from oc_cache import CHECK_KINDS, fetch_many
 
-# Split the output on commas and join with newlines
-formatted_output = "\n".join(data.split(","))
+def get_nodes():
+    """Return the cluster's node objects."""
+    # Nodes are fetched together with the other kinds the checker scripts need
+    try:
+        return fetch_many(CHECK_KINDS).get("Node", [])
+    except subprocess.CalledProcessError as e:
+        print("Error executing oc command:", e)
+        return []
 
-print(formatted_output)
+# Above this many labels the formatting is handed to pandas
+PANDAS_MIN_ROWS = 50000
 
+def write_labels(nodes, out):
+    """Write one "node<TAB>key=value" line per label to the binary stream `out`."""
+    if sum(len(node["metadata"].get("labels", {})) for node in nodes) >= PANDAS_MIN_ROWS:
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        if pd is not None:
+            # Build the lines with vectorized column operations
+            rows = [(node["metadata"]["name"], key, value)
+                    for node in nodes
+                    for key, value in node["metadata"].get("labels", {}).items()]
+            df = pd.DataFrame(rows, columns=["node", "key", "value"])
+            df["label"] = df["key"] + "=" + df["value"]
+            df[["node", "label"]].to_csv(out, sep="\t", header=False, index=False, encoding="utf-8")
+            return
+    # Emit node by node so only one node's lines are held at a time
+    for node in nodes:
+        metadata = node["metadata"]
+        name = metadata["name"]
+        out.write("".join([f"{name}\t{key}={value}\n"
+                           for key, value in metadata.get("labels", {}).items()]).encode("utf-8"))
+
+def main():
+    write_labels(get_nodes(), sys.stdout.buffer)
+    sys.stdout.buffer.flush()
+
+if __name__ == "__main__":
+    main()
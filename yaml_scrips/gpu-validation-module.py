@@ -8,423 +8,617 @@ to NVIDIA GPU setup, driver installation, and container configuration.
 
 import os
 import subprocess
+import sys
 import re
 import json
 import logging
-from typing import Dict, List, Tuple, Any, Optional
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Dict, List, Tuple, Any, Callable, Iterator, Optional
+
+# orjson parses large node/pod lists noticeably faster; its decode error
+# subclasses json.JSONDecodeError, so error handling is unchanged. It also
+# serializes the manifests sent to oc, already in compact form.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("gpu_validator")
 
+# Shared read-only default for missing mappings in parsed oc output; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+# Multipliers for the suffixes a Kubernetes resource quantity may carry
+_QUANTITY_SUFFIXES = {
+    "": 1, "m": Decimal("0.001"),
+    "k": 10**3, "M": 10**6, "G": 10**9, "T": 10**12, "P": 10**15, "E": 10**18,
+    "Ki": 2**10, "Mi": 2**20, "Gi": 2**30, "Ti": 2**40, "Pi": 2**50, "Ei": 2**60,
+}
+_QUANTITY_RE = re.compile(r"([0-9.]+)(m|[kMGTPE]|[KMGTPE]i)?")
+
+def _parse_quantity(quantity: str) -> int:
+    """Convert a Kubernetes quantity string such as "2" or "1k" to an int; 0 if unparseable."""
+    match = _QUANTITY_RE.fullmatch(quantity.strip())
+    if not match:
+        return 0
+    try:
+        return int(Decimal(match.group(1)) * _QUANTITY_SUFFIXES[match.group(2) or ""])
+    except InvalidOperation:
+        return 0
+
+def _gpu_count(node: Dict[str, Any]) -> int:
+    """
+    Number of NVIDIA GPUs in a node's capacity. The parsed count is kept on
+    the node dict, so the other checks reading the same cached node list do
+    not parse it again.
+    """
+    count = node.get("_gpu_count")
+    if count is None:
+        capacity = (node.get("status") or _EMPTY).get("capacity") or _EMPTY
+        count = node["_gpu_count"] = _parse_quantity(capacity.get("nvidia.com/gpu") or "0")
+    return count
+
+# Per-object entries collected while walking the cluster's pods and nodes;
+# converted to plain dicts only when written into the validation results.
+# Slots are declared by hand since dataclass(slots=True) needs Python 3.10.
+@dataclass
+class ProblemPod:
+    """An operator pod that is not running."""
+    __slots__ = ("name", "phase", "reasons")
+    name: str
+    phase: str
+    reasons: List[str]
+
+@dataclass
+class GpuNode:
+    """A node exposing NVIDIA GPUs."""
+    __slots__ = ("name", "gpu_count")
+    name: str
+    gpu_count: str
+
 class GPUValidator:
     """
     Main class for validating GPU configuration in OpenShift environments.
     """
+
+    # Seconds a fetched resource list is reused before it is requested again
+    LIST_CACHE_TTL = 30
+    # Upper bound on nodes checked with nvidia-smi at the same time
+    MAX_PARALLEL_NODE_CHECKS = 10
+    # Most problematic operator pods listed in a result
+    MAX_REPORTED_PODS = 100
+    # Seconds to wait for an nvidia-smi debug pod to become ready
+    DEBUG_POD_READY_TIMEOUT = 60
+    # Most recent workload log lines scanned for GPU errors
+    WORKLOAD_LOG_TAIL_LINES = 2000
+    
+    # Common GPU errors looked for in workload logs
+    GPU_LOG_ERRORS = (
+        "CUDA_ERROR_NOT_INITIALIZED",
+        "CUDA_ERROR_NO_DEVICE",
+        "Failed to initialize NVML",
+        "no CUDA-capable device is detected",
+        "NVIDIA-SMI has failed"
+    )
+    _GPU_ERROR_RE = re.compile("|".join(re.escape(error) for error in GPU_LOG_ERRORS))
     
-    def __init__(self, namespace: str = "nvidia-gpu-operator"):
+    # Key GPU feature discovery labels
+    _EXPECTED_LABELS = frozenset({
+        "feature.node.kubernetes.io/pci-10de.present",  # NVIDIA vendor ID
+        "nvidia.com/gpu.present",
+        "nvidia.com/gpu.count",
+        "nvidia.com/gpu.product",
+        "nvidia.com/gpu.memory"
+    })
+    
+    # How each result status is shown by print_validation_results
+    _STATUS_LABELS = {
+        "passed": "✅ PASSED",
+        "failed": "❌ FAILED",
+        "warning": "⚠️ WARNING"
+    }
+    
+    # Debug pod used to run nvidia-smi on a node; metadata.name and
+    # spec.nodeSelector are filled in per node
+    _DEBUG_POD_TEMPLATE = {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "spec": {
+            "containers": [{
+                "name": "nvidia-smi-debug",
+                "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
+                "command": ["sleep", "infinity"],
+                "resources": {
+                    "limits": {
+                        "nvidia.com/gpu": "1"
+                    }
+                }
+            }],
+            "restartPolicy": "Never"
+        }
+    }
+    
+    # nvidia-smi output parsing
+    _DRIVER_VERSION_RE = re.compile(r"Driver Version: (\d+\.\d+\.\d+)")
+    # A GPU's two lines in the three-column device table: the one starting
+    # with its index and name, and the usage one with the memory (MiB) and
+    # utilization (%) figures. Process table rows have a single column.
+    _GPU_INFO_RE = re.compile(
+        r"^\|\s+\d+\s+[^|]*\|[^|]*\|[^|]*\|[ \t]*$"
+        r"|^\|[^|]*\|[^|]*MiB[^|]*\|[^|]*%[^|]*\|[ \t]*$",
+        re.MULTILINE
+    )
+    
+    def __init__(self, namespace: str = "nvidia-gpu-operator", reuse_between_runs: bool = False):
         """
         Initialize the GPU validator.
         
         Args:
             namespace: The OpenShift namespace where GPU operators are installed
+            reuse_between_runs: Keep fetched resource lists across calls to
+                run_all_validations and to the individual checks (for
+                long-lived callers that validate repeatedly) instead of
+                reusing the namespace lists only within one run
         """
         self.namespace = namespace
+        self.reuse_between_runs = reuse_between_runs
         self.validation_results = {}
+        self._list_cache = {}
+        # Set while run_all_validations runs, so its checks share the lists
+        self._in_run = False
+        self._results_lock = threading.Lock()
     
-    def run_command(self, command: List[str]) -> Tuple[str, str, int]:
+    def run_command(self, command: List[str], input: Optional[str] = None,
+                    _popen: Callable[..., subprocess.Popen] = subprocess.Popen) -> Tuple[str, str, int]:
         """
         Run a shell command and return its output.
         
         Args:
             command: List of command components
+            input: Optional text to feed to the command's stdin
+            _popen: Factory used to start the process; tests pass a stand-in
             
         Returns:
             Tuple of (stdout, stderr, return_code)
         """
         try:
-            process = subprocess.Popen(
+            stdin = {"stdin": subprocess.PIPE} if input is not None else {}
+            process = _popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                universal_newlines=True
+                universal_newlines=True,
+                **stdin
             )
-            stdout, stderr = process.communicate()
+            stdout, stderr = process.communicate(input)
             return stdout, stderr, process.returncode
         except Exception as e:
             logger.error(f"Error executing command {' '.join(command)}: {str(e)}")
             return "", str(e), 1
     
+    def _record(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a validation result; safe to call from worker threads."""
+        with self._results_lock:
+            self.validation_results[key] = result
+    
+    def _order_results(self, keys: List[str]) -> None:
+        """
+        Move the results recorded under keys to the end of validation_results,
+        in the given order, so checks run side by side always report in the
+        same order.
+        """
+        with self._results_lock:
+            for key in keys:
+                if key in self.validation_results:
+                    self.validation_results[key] = self.validation_results.pop(key)
+    
+    def _cached_list(self, command: List[str]) -> Optional[Tuple[Optional[Dict[str, Any]], str, str, int]]:
+        """Return a still-fresh cached result for the list command, if any."""
+        entry = self._list_cache.get(tuple(command))
+        if entry is not None and time.monotonic() - entry[0] < self.LIST_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _get_list(self, command: List[str], always_cache: bool = False) -> Tuple[Optional[Dict[str, Any]], str, str, int]:
+        """
+        Run an `oc get ... -o json` command and parse its output, reusing a
+        recent result of the same command.
+        
+        Args:
+            command: List of command components
+            always_cache: Reuse a recent result even outside
+                run_all_validations. Otherwise results are reused only within
+                a run, or when reuse_between_runs is set, so a caller polling
+                a check directly sees the current state.
+            
+        Returns:
+            Tuple of (data, stdout, stderr, return_code); data is None if the
+            command failed or its output was not valid JSON
+        """
+        use_cache = always_cache or self._in_run or self.reuse_between_runs
+        cached = self._cached_list(command) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        stdout, stderr, return_code = self.run_command(command)
+        data = None
+        if return_code == 0:
+            try:
+                data = _json_loads(stdout)
+            except json.JSONDecodeError:
+                pass
+        
+        result = (data, stdout, stderr, return_code)
+        if use_cache and data is not None:
+            self._list_cache[tuple(command)] = (time.monotonic(), result)
+        return result
+    
+    def _get_nodes(self) -> Tuple[Optional[Dict[str, Any]], str, str, int]:
+        """
+        Fetch and parse the cluster node list, reusing a recent result.
+        
+        Returns:
+            Tuple of (node_data, stdout, stderr, return_code); node_data is
+            None if the command failed or its output was not valid JSON
+        """
+        # Nodes change rarely, and the node checks share one list even
+        # when called on their own
+        return self._get_list(["oc", "get", "nodes", "-o", "json"], always_cache=True)
+    
     def validate_oc_connection(self) -> bool:
         """Check if OpenShift client is connected to a cluster."""
         stdout, stderr, return_code = self.run_command(["oc", "whoami"])
         
         if return_code != 0:
-            self.validation_results["oc_connection"] = {
+            self._record("oc_connection", {
                 "status": "failed",
                 "message": "Not connected to OpenShift cluster. Please run 'oc login' first.",
                 "details": stderr
-            }
+            })
             return False
         
-        self.validation_results["oc_connection"] = {
+        self._record("oc_connection", {
             "status": "passed",
             "message": f"Connected to OpenShift cluster as {stdout.strip()}"
-        }
+        })
         return True
     
     def validate_gpu_operator_installation(self) -> bool:
         """Check if GPU operator is installed and which version."""
-        stdout, stderr, return_code = self.run_command([
+        csv_data, stdout, stderr, return_code = self._get_list([
             "oc", "get", "csv", "-n", self.namespace, "-o", "json"
         ])
         
         if return_code != 0:
-            self.validation_results["gpu_operator"] = {
+            self._record("gpu_operator", {
                 "status": "failed",
                 "message": f"Failed to get ClusterServiceVersions from {self.namespace} namespace",
                 "details": stderr
-            }
+            })
             return False
         
-        try:
-            csv_data = json.loads(stdout)
-            items = csv_data.get("items", [])
-            gpu_operator_found = False
-            
-            for item in items:
-                name = item.get("metadata", {}).get("name", "")
-                if "gpu-operator" in name.lower():
-                    gpu_operator_found = True
-                    version = item.get("spec", {}).get("version", "unknown")
-                    self.validation_results["gpu_operator"] = {
-                        "status": "passed",
-                        "message": f"GPU Operator installed, version: {version}",
-                        "details": {
-                            "name": name,
-                            "version": version
-                        }
-                    }
-                    break
-            
-            if not gpu_operator_found:
-                self.validation_results["gpu_operator"] = {
-                    "status": "failed",
-                    "message": "GPU Operator not found in the specified namespace",
-                }
-                return False
-            
-            return True
-                
-        except json.JSONDecodeError:
-            self.validation_results["gpu_operator"] = {
+        if csv_data is None:
+            self._record("gpu_operator", {
                 "status": "failed",
                 "message": "Failed to parse JSON output from OpenShift",
                 "details": stdout
-            }
+            })
+            return False
+        
+        items = csv_data.get("items", [])
+        gpu_operator_found = False
+        
+        for item in items:
+            name = item.get("metadata", {}).get("name", "")
+            if "gpu-operator" in name.lower():
+                gpu_operator_found = True
+                version = item.get("spec", {}).get("version", "unknown")
+                self._record("gpu_operator", {
+                    "status": "passed",
+                    "message": f"GPU Operator installed, version: {version}",
+                    "details": {
+                        "name": name,
+                        "version": version
+                    }
+                })
+                break
+        
+        if not gpu_operator_found:
+            self._record("gpu_operator", {
+                "status": "failed",
+                "message": "GPU Operator not found in the specified namespace",
+            })
             return False
+        
+        return True
+    
+    @staticmethod
+    def _iter_problematic_pods(pods: List[Dict[str, Any]]) -> Iterator[ProblemPod]:
+        """Yield name, phase and container reasons for each pod that is not running."""
+        for pod in pods:
+            pod_status = pod.get("status") or _EMPTY
+            phase = pod_status.get("phase", "Unknown")
+            if phase == "Running":
+                continue
+            
+            reasons = []
+            for container in pod_status.get("containerStatuses") or ():
+                if not container.get("ready", False):
+                    waiting = (container.get("state") or _EMPTY).get("waiting") or _EMPTY
+                    reason = waiting.get("reason", "Unknown")
+                    message = waiting.get("message", "No details available")
+                    reasons.append(f"{reason}: {message}")
+            
+            yield ProblemPod((pod.get("metadata") or _EMPTY).get("name", "unknown"), phase, reasons)
     
     def validate_gpu_operator_pods(self) -> bool:
         """Check if all GPU operator pods are running."""
-        stdout, stderr, return_code = self.run_command([
-            "oc", "get", "pods", "-n", self.namespace, "-o", "json"
+        # Let the API server drop healthy pods; only the rest need inspecting
+        pod_data, stdout, stderr, return_code = self._get_list([
+            "oc", "get", "pods", "-n", self.namespace,
+            "--field-selector=status.phase!=Running", "-o", "json"
         ])
         
         if return_code != 0:
-            self.validation_results["gpu_operator_pods"] = {
+            self._record("gpu_operator_pods", {
                 "status": "failed",
                 "message": f"Failed to get pods from {self.namespace} namespace",
                 "details": stderr
-            }
+            })
             return False
         
-        try:
-            pod_data = json.loads(stdout)
-            pods = pod_data.get("items", [])
-            
-            problematic_pods = []
-            for pod in pods:
-                pod_name = pod.get("metadata", {}).get("name", "unknown")
-                pod_status = pod.get("status", {})
-                phase = pod_status.get("phase", "Unknown")
-                
-                if phase != "Running":
-                    container_statuses = pod_status.get("containerStatuses", [])
-                    reasons = []
-                    
-                    for container in container_statuses:
-                        if not container.get("ready", False):
-                            waiting = container.get("state", {}).get("waiting", {})
-                            reason = waiting.get("reason", "Unknown")
-                            message = waiting.get("message", "No details available")
-                            reasons.append(f"{reason}: {message}")
-                    
-                    problematic_pods.append({
-                        "name": pod_name,
-                        "phase": phase,
-                        "reasons": reasons
-                    })
-            
-            if problematic_pods:
-                self.validation_results["gpu_operator_pods"] = {
-                    "status": "failed",
-                    "message": f"Found {len(problematic_pods)} problematic pods",
-                    "details": problematic_pods
-                }
-                return False
-            else:
-                self.validation_results["gpu_operator_pods"] = {
-                    "status": "passed",
-                    "message": f"All pods in {self.namespace} namespace are running"
-                }
-                return True
-                
-        except json.JSONDecodeError:
-            self.validation_results["gpu_operator_pods"] = {
+        if pod_data is None:
+            self._record("gpu_operator_pods", {
                 "status": "failed",
                 "message": "Failed to parse JSON output from OpenShift",
                 "details": stdout
-            }
+            })
+            return False
+        
+        # Stop building details once enough problematic pods have been found
+        problematic = self._iter_problematic_pods(pod_data.get("items", []))
+        problematic_pods = list(islice(problematic, self.MAX_REPORTED_PODS))
+        more = next(problematic, None) is not None
+        
+        if problematic_pods:
+            self._record("gpu_operator_pods", {
+                "status": "failed",
+                "message": f"Found {len(problematic_pods)}{'+' if more else ''} problematic pods",
+                "details": [asdict(pod) for pod in problematic_pods]
+            })
             return False
+        else:
+            self._record("gpu_operator_pods", {
+                "status": "passed",
+                "message": f"All pods in {self.namespace} namespace are running"
+            })
+            return True
     
     def validate_node_gpu_status(self) -> bool:
         """Check if GPUs are properly exposed on nodes."""
-        stdout, stderr, return_code = self.run_command([
-            "oc", "get", "nodes", "-o", "json"
-        ])
+        node_data, stdout, stderr, return_code = self._get_nodes()
         
         if return_code != 0:
-            self.validation_results["node_gpu_status"] = {
+            self._record("node_gpu_status", {
                 "status": "failed",
                 "message": "Failed to get nodes information",
                 "details": stderr
-            }
+            })
             return False
         
-        try:
-            node_data = json.loads(stdout)
-            nodes = node_data.get("items", [])
-            
-            nodes_with_gpus = []
-            nodes_without_gpus = []
-            
-            for node in nodes:
-                node_name = node.get("metadata", {}).get("name", "unknown")
-                capacity = node.get("status", {}).get("capacity", {})
-                
-                # Check for NVIDIA GPUs
-                nvidia_gpu_count = capacity.get("nvidia.com/gpu", "0")
-                
-                if nvidia_gpu_count and int(nvidia_gpu_count) > 0:
-                    nodes_with_gpus.append({
-                        "name": node_name,
-                        "gpu_count": nvidia_gpu_count
-                    })
-                else:
-                    nodes_without_gpus.append(node_name)
-            
-            if not nodes_with_gpus:
-                self.validation_results["node_gpu_status"] = {
-                    "status": "failed",
-                    "message": "No nodes with GPUs found in the cluster",
-                    "details": {
-                        "nodes_checked": len(nodes),
-                        "nodes_without_gpus": nodes_without_gpus
-                    }
-                }
-                return False
-            else:
-                self.validation_results["node_gpu_status"] = {
-                    "status": "passed",
-                    "message": f"Found {len(nodes_with_gpus)} nodes with GPUs",
-                    "details": {
-                        "nodes_with_gpus": nodes_with_gpus,
-                        "nodes_without_gpus": nodes_without_gpus
-                    }
-                }
-                return True
-                
-        except json.JSONDecodeError:
-            self.validation_results["node_gpu_status"] = {
+        if node_data is None:
+            self._record("node_gpu_status", {
                 "status": "failed",
                 "message": "Failed to parse JSON output from OpenShift",
                 "details": stdout
-            }
+            })
             return False
+        
+        nodes = node_data.get("items", [])
+        
+        nodes_with_gpus = []
+        nodes_without_gpus = []
+        
+        for node in nodes:
+            node_name = (node.get("metadata") or _EMPTY).get("name", "unknown")
+            capacity = (node.get("status") or _EMPTY).get("capacity") or _EMPTY
+            
+            # Check for NVIDIA GPUs
+            if _gpu_count(node) > 0:
+                nodes_with_gpus.append(GpuNode(node_name, capacity.get("nvidia.com/gpu", "0")))
+            else:
+                nodes_without_gpus.append(node_name)
+        
+        if not nodes_with_gpus:
+            self._record("node_gpu_status", {
+                "status": "failed",
+                "message": "No nodes with GPUs found in the cluster",
+                "details": {
+                    "nodes_checked": len(nodes),
+                    "nodes_without_gpus": nodes_without_gpus
+                }
+            })
+            return False
+        else:
+            self._record("node_gpu_status", {
+                "status": "passed",
+                "message": f"Found {len(nodes_with_gpus)} nodes with GPUs",
+                "details": {
+                    "nodes_with_gpus": [asdict(node) for node in nodes_with_gpus],
+                    "nodes_without_gpus": nodes_without_gpus
+                }
+            })
+            return True
     
     def validate_gpu_feature_discovery(self) -> bool:
         """Check if GPU feature discovery is working."""
-        stdout, stderr, return_code = self.run_command([
-            "oc", "get", "nodes", "-o", "json"
-        ])
+        # GPU nodes are picked out by capacity, so those missing the vendor
+        # label are reported too; the node list is shared with the other checks
+        node_data, stdout, stderr, return_code = self._get_nodes()
         
         if return_code != 0:
-            self.validation_results["gpu_feature_discovery"] = {
+            self._record("gpu_feature_discovery", {
                 "status": "failed",
                 "message": "Failed to get nodes information",
                 "details": stderr
-            }
+            })
             return False
         
-        try:
-            node_data = json.loads(stdout)
-            nodes = node_data.get("items", [])
+        if node_data is None:
+            self._record("gpu_feature_discovery", {
+                "status": "failed",
+                "message": "Failed to parse JSON output from OpenShift",
+                "details": stdout
+            })
+            return False
+        
+        nodes = node_data.get("items", [])
+        
+        nodes_with_gpu_labels = []
+        nodes_missing_labels = []
+        
+        for node in nodes:
+            metadata = node.get("metadata") or _EMPTY
+            node_name = metadata.get("name", "unknown")
+            labels = metadata.get("labels") or _EMPTY
             
-            nodes_with_gpu_labels = []
-            nodes_missing_labels = []
+            # Check if node has GPUs
+            if _gpu_count(node) == 0:
+                continue
             
-            for node in nodes:
-                node_name = node.get("metadata", {}).get("name", "unknown")
-                labels = node.get("metadata", {}).get("labels", {})
-                capacity = node.get("status", {}).get("capacity", {})
-                
-                # Check if node has GPUs
-                nvidia_gpu_count = capacity.get("nvidia.com/gpu", "0")
-                if int(nvidia_gpu_count) == 0:
-                    continue
-                
-                # Check for GPU feature discovery labels
-                gpu_labels = {}
-                missing_labels = []
-                
-                # Key GPU feature discovery labels
-                expected_labels = [
-                    "feature.node.kubernetes.io/pci-10de.present",  # NVIDIA vendor ID
-                    "nvidia.com/gpu.present",
-                    "nvidia.com/gpu.count",
-                    "nvidia.com/gpu.product",
-                    "nvidia.com/gpu.memory"
-                ]
-                
-                for label in expected_labels:
-                    if label in labels:
-                        gpu_labels[label] = labels[label]
-                    else:
-                        missing_labels.append(label)
-                
-                if missing_labels:
-                    nodes_missing_labels.append({
-                        "name": node_name,
-                        "missing_labels": missing_labels,
-                        "existing_gpu_labels": gpu_labels
-                    })
-                else:
-                    nodes_with_gpu_labels.append({
-                        "name": node_name,
-                        "gpu_labels": gpu_labels
-                    })
+            # Check for GPU feature discovery labels
+            label_keys = labels.keys()
+            gpu_labels = {label: labels[label] for label in self._EXPECTED_LABELS & label_keys}
+            missing_labels = sorted(self._EXPECTED_LABELS - label_keys)
             
-            if nodes_missing_labels:
-                self.validation_results["gpu_feature_discovery"] = {
-                    "status": "failed",
-                    "message": f"Found {len(nodes_missing_labels)} nodes with missing GPU feature labels",
-                    "details": {
-                        "nodes_with_complete_labels": nodes_with_gpu_labels,
-                        "nodes_with_missing_labels": nodes_missing_labels
-                    }
-                }
-                return False
-            elif not nodes_with_gpu_labels:
-                self.validation_results["gpu_feature_discovery"] = {
-                    "status": "failed",
-                    "message": "No nodes with GPU feature labels found",
-                }
-                return False
+            if missing_labels:
+                nodes_missing_labels.append({
+                    "name": node_name,
+                    "missing_labels": missing_labels,
+                    "existing_gpu_labels": gpu_labels
+                })
             else:
-                self.validation_results["gpu_feature_discovery"] = {
-                    "status": "passed",
-                    "message": f"Found {len(nodes_with_gpu_labels)} nodes with proper GPU feature labels",
-                    "details": {
-                        "nodes": nodes_with_gpu_labels
-                    }
+                nodes_with_gpu_labels.append({
+                    "name": node_name,
+                    "gpu_labels": gpu_labels
+                })
+        
+        if nodes_missing_labels:
+            self._record("gpu_feature_discovery", {
+                "status": "failed",
+                "message": f"Found {len(nodes_missing_labels)} nodes with missing GPU feature labels",
+                "details": {
+                    "nodes_with_complete_labels": nodes_with_gpu_labels,
+                    "nodes_with_missing_labels": nodes_missing_labels
                 }
-                return True
-                
-        except json.JSONDecodeError:
-            self.validation_results["gpu_feature_discovery"] = {
+            })
+            return False
+        elif not nodes_with_gpu_labels:
+            self._record("gpu_feature_discovery", {
                 "status": "failed",
-                "message": "Failed to parse JSON output from OpenShift",
-                "details": stdout
-            }
+                "message": "No nodes with GPU feature labels found",
+            })
             return False
+        else:
+            self._record("gpu_feature_discovery", {
+                "status": "passed",
+                "message": f"Found {len(nodes_with_gpu_labels)} nodes with proper GPU feature labels",
+                "details": {
+                    "nodes": nodes_with_gpu_labels
+                }
+            })
+            return True
     
     def validate_driver_daemonset(self) -> bool:
         """Check if NVIDIA driver daemonset is properly installed."""
-        stdout, stderr, return_code = self.run_command([
+        ds_data, stdout, stderr, return_code = self._get_list([
             "oc", "get", "daemonset", "-n", self.namespace, "-o", "json"
         ])
         
         if return_code != 0:
-            self.validation_results["driver_daemonset"] = {
+            self._record("driver_daemonset", {
                 "status": "failed",
                 "message": f"Failed to get daemonsets from {self.namespace} namespace",
                 "details": stderr
-            }
+            })
             return False
         
-        try:
-            ds_data = json.loads(stdout)
-            daemonsets = ds_data.get("items", [])
-            
-            driver_ds = None
-            for ds in daemonsets:
-                name = ds.get("metadata", {}).get("name", "")
-                if "nvidia-driver" in name.lower():
-                    driver_ds = ds
-                    break
-            
-            if not driver_ds:
-                self.validation_results["driver_daemonset"] = {
-                    "status": "failed",
-                    "message": "NVIDIA driver daemonset not found"
-                }
-                return False
-            
-            # Check daemonset status
-            status = driver_ds.get("status", {})
-            desired_count = status.get("desiredNumberScheduled", 0)
-            current_count = status.get("currentNumberScheduled", 0)
-            ready_count = status.get("numberReady", 0)
-            
-            if desired_count == 0:
-                self.validation_results["driver_daemonset"] = {
-                    "status": "failed",
-                    "message": "NVIDIA driver daemonset exists but is not scheduled on any nodes",
-                }
-                return False
-            
-            if ready_count < desired_count:
-                self.validation_results["driver_daemonset"] = {
-                    "status": "failed",
-                    "message": f"NVIDIA driver daemonset not fully ready: {ready_count}/{desired_count} ready",
-                    "details": {
-                        "name": driver_ds.get("metadata", {}).get("name", ""),
-                        "desired": desired_count,
-                        "current": current_count,
-                        "ready": ready_count
-                    }
-                }
-                return False
-            
-            self.validation_results["driver_daemonset"] = {
-                "status": "passed",
-                "message": f"NVIDIA driver daemonset is running properly: {ready_count}/{desired_count} ready",
+        if ds_data is None:
+            self._record("driver_daemonset", {
+                "status": "failed",
+                "message": "Failed to parse JSON output from OpenShift",
+                "details": stdout
+            })
+            return False
+        
+        daemonsets = ds_data.get("items", [])
+        
+        driver_ds = None
+        for ds in daemonsets:
+            name = (ds.get("metadata") or _EMPTY).get("name", "")
+            if "nvidia-driver" in name.lower():
+                driver_ds = ds
+                break
+        
+        if not driver_ds:
+            self._record("driver_daemonset", {
+                "status": "failed",
+                "message": "NVIDIA driver daemonset not found"
+            })
+            return False
+        
+        # Check daemonset status
+        status = driver_ds.get("status", {})
+        desired_count = status.get("desiredNumberScheduled", 0)
+        current_count = status.get("currentNumberScheduled", 0)
+        ready_count = status.get("numberReady", 0)
+        
+        if desired_count == 0:
+            self._record("driver_daemonset", {
+                "status": "failed",
+                "message": "NVIDIA driver daemonset exists but is not scheduled on any nodes",
+            })
+            return False
+        
+        if ready_count < desired_count:
+            self._record("driver_daemonset", {
+                "status": "failed",
+                "message": f"NVIDIA driver daemonset not fully ready: {ready_count}/{desired_count} ready",
                 "details": {
                     "name": driver_ds.get("metadata", {}).get("name", ""),
                     "desired": desired_count,
                     "current": current_count,
                     "ready": ready_count
                 }
-            }
-            return True
-                
-        except json.JSONDecodeError:
-            self.validation_results["driver_daemonset"] = {
-                "status": "failed",
-                "message": "Failed to parse JSON output from OpenShift",
-                "details": stdout
-            }
+            })
             return False
+        
+        self._record("driver_daemonset", {
+            "status": "passed",
+            "message": f"NVIDIA driver daemonset is running properly: {ready_count}/{desired_count} ready",
+            "details": {
+                "name": driver_ds.get("metadata", {}).get("name", ""),
+                "desired": desired_count,
+                "current": current_count,
+                "ready": ready_count
+            }
+        })
+        return True
     
     def validate_gpu_workload(self, namespace: str, pod_name: str) -> bool:
         """
@@ -439,15 +633,15 @@ class GPUValidator:
         ])
         
         if return_code != 0:
-            self.validation_results["gpu_workload"] = {
+            self._record("gpu_workload", {
                 "status": "failed",
                 "message": f"Failed to get pod {pod_name} in namespace {namespace}",
                 "details": stderr
-            }
+            })
             return False
         
         try:
-            pod_data = json.loads(stdout)
+            pod_data = _json_loads(stdout)
             phase = pod_data.get("status", {}).get("phase", "Unknown")
             
             if phase != "Running":
@@ -462,13 +656,13 @@ class GPUValidator:
                         message = waiting.get("message", "No details available")
                         reasons.append(f"{reason}: {message}")
                 
-                self.validation_results["gpu_workload"] = {
+                self._record("gpu_workload", {
                     "status": "failed",
                     "message": f"GPU workload pod {pod_name} is not running (status: {phase})",
                     "details": {
                         "reasons": reasons
                     }
-                }
+                })
                 return False
             
             # Check for GPU allocation
@@ -480,19 +674,21 @@ class GPUValidator:
             gpu_request = requests.get("nvidia.com/gpu", "0")
             
             if gpu_limit == "0" and gpu_request == "0":
-                self.validation_results["gpu_workload"] = {
+                self._record("gpu_workload", {
                     "status": "failed",
                     "message": f"Pod {pod_name} is not requesting any GPUs",
-                }
+                })
                 return False
             
-            # Check for GPU usage in logs
+            # Check for GPU usage in the recent logs; a long-running pod's full
+            # log can be far larger than what is worth fetching and scanning
             stdout, stderr, return_code = self.run_command([
-                "oc", "logs", pod_name, "-n", namespace
+                "oc", "logs", pod_name, "-n", namespace,
+                f"--tail={self.WORKLOAD_LOG_TAIL_LINES}"
             ])
             
             if return_code != 0:
-                self.validation_results["gpu_workload"] = {
+                self._record("gpu_workload", {
                     "status": "warning",
                     "message": f"Pod {pod_name} is running but could not retrieve logs",
                     "details": {
@@ -500,49 +696,40 @@ class GPUValidator:
                         "gpu_request": gpu_request,
                         "log_error": stderr
                     }
-                }
+                })
                 return True
             
-            # Check for common GPU errors in logs
-            gpu_errors = [
-                "CUDA_ERROR_NOT_INITIALIZED",
-                "CUDA_ERROR_NO_DEVICE",
-                "Failed to initialize NVML",
-                "no CUDA-capable device is detected",
-                "NVIDIA-SMI has failed"
-            ]
-            
-            found_errors = []
-            for error in gpu_errors:
-                if error in stdout:
-                    found_errors.append(error)
+            # Check for common GPU errors in logs with a single scan
+            found_errors = list(dict.fromkeys(
+                match.group(0) for match in self._GPU_ERROR_RE.finditer(stdout)
+            ))
             
             if found_errors:
-                self.validation_results["gpu_workload"] = {
+                self._record("gpu_workload", {
                     "status": "failed",
                     "message": f"Pod {pod_name} has GPU-related errors in logs",
                     "details": {
                         "errors": found_errors
                     }
-                }
+                })
                 return False
             
-            self.validation_results["gpu_workload"] = {
+            self._record("gpu_workload", {
                 "status": "passed",
                 "message": f"GPU workload pod {pod_name} is running correctly",
                 "details": {
                     "gpu_limit": gpu_limit,
                     "gpu_request": gpu_request
                 }
-            }
+            })
             return True
                 
         except json.JSONDecodeError:
-            self.validation_results["gpu_workload"] = {
+            self._record("gpu_workload", {
                 "status": "failed",
                 "message": "Failed to parse JSON output from OpenShift",
                 "details": stdout
-            }
+            })
             return False
     
     def validate_nvidia_smi_on_node(self, node_name: str) -> bool:
@@ -552,171 +739,165 @@ class GPUValidator:
         Args:
             node_name: The name of the node to check
         """
-        debug_pod_name = f"nvidia-smi-debug-{node_name.split('.')[0]}"
+        # The pod is deleted without waiting, so a run shortly after this one
+        # may still find it terminating; a random suffix keeps their names apart
+        debug_pod_name = f"nvidia-smi-debug-{node_name.split('.')[0]}-{uuid.uuid4().hex[:5]}"
         
-        # Create a debug pod
+        # Create a debug pod; only its name and node differ from the template,
+        # whose shared parts are never mutated
         pod_json = {
-            "apiVersion": "v1",
-            "kind": "Pod",
+            **self._DEBUG_POD_TEMPLATE,
             "metadata": {
                 "name": debug_pod_name
             },
             "spec": {
-                "containers": [{
-                    "name": "nvidia-smi-debug",
-                    "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
-                    "command": ["sleep", "infinity"],
-                    "resources": {
-                        "limits": {
-                            "nvidia.com/gpu": "1"
-                        }
-                    }
-                }],
+                **self._DEBUG_POD_TEMPLATE["spec"],
                 "nodeSelector": {
                     "kubernetes.io/hostname": node_name
-                },
-                "restartPolicy": "Never"
+                }
             }
         }
         
-        # Create a temporary file for the pod definition
-        temp_file = "/tmp/nvidia-smi-debug.json"
-        with open(temp_file, "w") as f:
-            json.dump(pod_json, f)
-        
-        # Create the pod
+        # Create the pod, passing the manifest on stdin
         stdout, stderr, return_code = self.run_command([
-            "oc", "create", "-f", temp_file
-        ])
+            "oc", "create", "-f", "-"
+        ], input=_json_dumps(pod_json))
         
         if return_code != 0:
-            self.validation_results[f"nvidia_smi_{node_name}"] = {
+            self._record(f"nvidia_smi_{node_name}", {
                 "status": "failed",
                 "message": f"Failed to create debug pod on node {node_name}",
                 "details": stderr
-            }
+            })
             return False
         
-        # Wait for the pod to be running
-        import time
-        for _ in range(30):  # Wait up to 30 seconds
-            stdout, stderr, return_code = self.run_command([
-                "oc", "get", "pod", debug_pod_name, "-o", "json"
-            ])
-            
-            if return_code == 0:
-                pod_data = json.loads(stdout)
-                phase = pod_data.get("status", {}).get("phase", "Unknown")
-                if phase == "Running":
-                    break
-            
-            time.sleep(1)
+        # Wait for the pod to be ready; oc wait watches the pod server-side
+        # and returns as soon as the condition is met
+        stdout, stderr, return_code = self.run_command([
+            "oc", "wait", "--for=condition=Ready", f"pod/{debug_pod_name}",
+            f"--timeout={self.DEBUG_POD_READY_TIMEOUT}s"
+        ])
+        
+        if return_code != 0:
+            logger.warning(f"Debug pod {debug_pod_name} did not become ready: {stderr.strip()}")
         
         # Run nvidia-smi in the pod
         stdout, stderr, return_code = self.run_command([
             "oc", "exec", debug_pod_name, "--", "nvidia-smi"
         ])
         
-        # Clean up the pod
+        # Clean up the pod; the sleeping container has nothing to shut down
+        # gracefully, so don't wait out the default grace period
         self.run_command([
-            "oc", "delete", "pod", debug_pod_name
+            "oc", "delete", "pod", debug_pod_name, "--grace-period=1", "--wait=false"
         ])
         
         if return_code != 0:
-            self.validation_results[f"nvidia_smi_{node_name}"] = {
+            self._record(f"nvidia_smi_{node_name}", {
                 "status": "failed",
                 "message": f"nvidia-smi failed on node {node_name}",
                 "details": stderr
-            }
+            })
             return False
         
         # Check for expected output
         if "NVIDIA-SMI" in stdout and "Driver Version" in stdout:
             # Extract driver version
-            driver_version_match = re.search(r"Driver Version: (\d+\.\d+\.\d+)", stdout)
+            driver_version_match = self._DRIVER_VERSION_RE.search(stdout)
             driver_version = driver_version_match.group(1) if driver_version_match else "Unknown"
             
             # Extract GPU information
-            gpu_info = []
-            lines = stdout.strip().split("\n")
-            for i, line in enumerate(lines):
-                if "|" in line and "%" in line and "MiB" in line:
-                    gpu_info.append(line.strip())
+            gpu_info = [line.strip() for line in self._GPU_INFO_RE.findall(stdout)]
             
-            self.validation_results[f"nvidia_smi_{node_name}"] = {
+            self._record(f"nvidia_smi_{node_name}", {
                 "status": "passed",
                 "message": f"nvidia-smi is working on node {node_name}",
                 "details": {
                     "driver_version": driver_version,
                     "gpu_info": gpu_info
                 }
-            }
+            })
             return True
         else:
-            self.validation_results[f"nvidia_smi_{node_name}"] = {
+            self._record(f"nvidia_smi_{node_name}", {
                 "status": "failed",
                 "message": f"nvidia-smi output is not as expected on node {node_name}",
                 "details": stdout
-            }
+            })
             return False
     
     def run_all_validations(self) -> Dict[str, Any]:
         """Run all validations and return the results."""
+        self._in_run = True
+        try:
+            return self._run_all_validations()
+        finally:
+            self._in_run = False
+    
+    def _run_all_validations(self) -> Dict[str, Any]:
+        """Body of run_all_validations, run with the list cache enabled."""
+        # Start from fresh resource lists unless asked to reuse them
+        if not self.reuse_between_runs:
+            self._list_cache = {}
+        
         # Check OpenShift connection first
         if not self.validate_oc_connection():
             return self.validation_results
         
-        # Run all validations
-        self.validate_gpu_operator_installation()
-        self.validate_gpu_operator_pods()
-        self.validate_node_gpu_status()
-        self.validate_gpu_feature_discovery()
-        self.validate_driver_daemonset()
+        # The node checks share one node list; fetch it before they start so
+        # they don't each query it at the same time
+        self._get_nodes()
         
-        # Check GPU nodes with nvidia-smi
-        stdout, stderr, return_code = self.run_command([
-            "oc", "get", "nodes", "-o", "json"
-        ])
+        # The checks are independent and mostly wait on the cluster, so run
+        # them side by side. Each is paired with the key it records its
+        # result under
+        checks = [
+            ("gpu_operator", self.validate_gpu_operator_installation),
+            ("gpu_operator_pods", self.validate_gpu_operator_pods),
+            ("node_gpu_status", self.validate_node_gpu_status),
+            ("gpu_feature_discovery", self.validate_gpu_feature_discovery),
+            ("driver_daemonset", self.validate_driver_daemonset),
+        ]
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for future in [executor.submit(check) for _, check in checks]:
+                future.result()
+        # Report in check order rather than completion order
+        self._order_results([key for key, _ in checks])
         
-        if return_code == 0:
-            try:
-                node_data = json.loads(stdout)
-                nodes = node_data.get("items", [])
-                
-                for node in nodes:
-                    node_name = node.get("metadata", {}).get("name", "unknown")
-                    capacity = node.get("status", {}).get("capacity", {})
-                    
-                    # Check for NVIDIA GPUs
-                    nvidia_gpu_count = capacity.get("nvidia.com/gpu", "0")
-                    
-                    if nvidia_gpu_count and int(nvidia_gpu_count) > 0:
-                        self.validate_nvidia_smi_on_node(node_name)
-            except json.JSONDecodeError:
-                logger.error("Failed to parse JSON output from OpenShift")
+        # Check GPU nodes with nvidia-smi, reusing the node list fetched above
+        node_data = self._get_nodes()[0]
+        if node_data is None:
+            logger.error("Failed to get nodes information")
+            return self.validation_results
+        
+        gpu_nodes = []
+        for node in node_data.get("items", []):
+            # Check for NVIDIA GPUs
+            if _gpu_count(node) > 0:
+                gpu_nodes.append((node.get("metadata") or _EMPTY).get("name", "unknown"))
+        
+        # Each check mostly waits on the cluster, so run them side by side
+        if gpu_nodes:
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_NODE_CHECKS) as executor:
+                list(executor.map(self.validate_nvidia_smi_on_node, gpu_nodes))
+            self._order_results([f"nvidia_smi_{node_name}" for node_name in gpu_nodes])
         
         return self.validation_results
     
     def print_validation_results(self) -> None:
         """Print validation results in a human-readable format."""
-        print("\n===== GPU Validation Results =====\n")
+        lines = ["\n===== GPU Validation Results =====\n"]
         
         for validation_name, result in self.validation_results.items():
             status = result.get("status", "unknown")
             message = result.get("message", "No message")
-            
-            if status == "passed":
-                status_str = "✅ PASSED"
-            elif status == "failed":
-                status_str = "❌ FAILED"
-            elif status == "warning":
-                status_str = "⚠️ WARNING"
-            else:
-                status_str = "❓ UNKNOWN"
-            
-            print(f"{status_str} - {validation_name}: {message}")
+            status_str = self._STATUS_LABELS.get(status, "❓ UNKNOWN")
+            lines.append(f"{status_str} - {validation_name}: {message}")
         
-        print("\nFor detailed results, use the .validation_results dictionary.")
+        lines.append("\nFor detailed results, use the .validation_results dictionary.\n")
+        
+        # Emit the report in one write rather than one print per line
+        sys.stdout.write("\n".join(lines))
 
 def validate_gpu_setup(namespace: str = "nvidia-gpu-operator") -> Dict[str, Any]:
     """
@@ -750,6 +931,158 @@ def test_gpu_workload(namespace: str, pod_name: str) -> bool:
     validator.print_validation_results()
     return result
 
+# Retries, with exponential backoff, when the API server throttles a request
+APPLY_RETRIES = 5
+APPLY_BACKOFF = 0.5  # seconds before the first retry
+_THROTTLED_ERRORS = ("(TooManyRequests)", "(ServiceUnavailable)")
+# Field manager recorded by server-side apply for the resources made here
+FIELD_MANAGER = "gpu-validator"
+# Bound on a single oc API request, so a stalled API server fails the call
+# instead of hanging a worker; not used for oc wait and oc exec, whose
+# requests legitimately stay open
+OC_REQUEST_TIMEOUT = "10s"
+
+def _oc_apply(manifest: Dict[str, Any]) -> subprocess.CompletedProcess:
+    """
+    Server-side apply a manifest with `oc apply -f -`, passing it on stdin.
+    Applying is idempotent, so resubmitting a manifest whose resources
+    already exist is a no-op instead of an AlreadyExists error; this also
+    makes it safe to back off and resubmit a whole List while the API
+    server is shedding load.
+    """
+    manifest_json = _json_dumps(manifest)
+    for attempt in range(APPLY_RETRIES + 1):
+        result = subprocess.run(
+            ["oc", "apply", "--server-side", f"--field-manager={FIELD_MANAGER}",
+             "--force-conflicts", f"--request-timeout={OC_REQUEST_TIMEOUT}", "-f", "-"],
+            input=manifest_json,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+        if result.returncode == 0 or attempt == APPLY_RETRIES:
+            break
+        if not any(error in result.stderr for error in _THROTTLED_ERRORS):
+            break
+        time.sleep(APPLY_BACKOFF * 2 ** attempt)
+    return result
+
+class NodeCache:
+    """
+    Names of the cluster's nodes, listed once and then reused for `ttl`
+    seconds, so node names can be checked without an API call each time.
+    Safe to share between threads.
+    """
+    
+    def __init__(self, ttl: float = 30):
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._names: Optional[frozenset] = None
+        self._fetched_at = 0.0
+    
+    def names(self) -> Optional[frozenset]:
+        """Return the node names, or None if they have never been listed successfully."""
+        with self._lock:
+            if self._names is None or time.monotonic() - self._fetched_at >= self.ttl:
+                result = subprocess.run(
+                    ["oc", "get", "nodes", "-o", "name", f"--request-timeout={OC_REQUEST_TIMEOUT}"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True
+                )
+                if result.returncode != 0:
+                    # Keep serving the previous list, if any
+                    logger.warning(f"Failed to list nodes: {result.stderr}")
+                    return self._names
+                # oc prints one "node/<name>" per line
+                self._names = frozenset(line.partition("/")[2] for line in result.stdout.split())
+                self._fetched_at = time.monotonic()
+            return self._names
+    
+    def is_known(self, node_name: str) -> bool:
+        """
+        Check that a node exists. Returns True when the node list cannot be
+        fetched, so callers only reject names that are known to be wrong.
+        """
+        names = self.names()
+        return names is None or node_name in names
+
+# Shared by the GPU test helpers to reject unknown nodes up front, rather
+# than creating pods that would stay Pending forever
+node_cache = NodeCache()
+
+# "app" label carried by every GPU test pod
+GPU_TEST_POD_LABEL = "gpu-validator"
+# Seconds a GPU test pod or job may run before it is stopped, so a forgotten
+# one does not hold its GPU; longer than TEST_POD_READY_TIMEOUT. A stopped bare
+# pod stays behind as a Failed object; only jobs are garbage collected
+GPU_TEST_ACTIVE_DEADLINE = 300
+# Seconds a finished GPU test job is kept before it is garbage collected
+GPU_TEST_JOB_TTL = 30
+
+# Fixed part of every GPU test pod; _gpu_test_pod_manifest copies only the
+# parts it fills in, the rest is shared and must never be mutated
+_GPU_TEST_POD_TEMPLATE = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "labels": {
+            "app": GPU_TEST_POD_LABEL
+        }
+    },
+    "spec": {
+        "containers": [{
+            "name": "gpu-test",
+            "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
+            "command": [
+                "sh",
+                "-c",
+                "nvidia-smi && touch /tmp/gpu-ready && sleep 3600"
+            ],
+            # The pod only turns Ready once nvidia-smi has succeeded; the
+            # kubelet checks this locally and the change is pushed to
+            # watchers, so nobody needs to poll the API server for it
+            "readinessProbe": {
+                "exec": {
+                    "command": ["cat", "/tmp/gpu-ready"]
+                },
+                "periodSeconds": 1
+            },
+            "resources": {
+                "limits": {
+                    "nvidia.com/gpu": "1"
+                }
+            }
+        }],
+        "activeDeadlineSeconds": GPU_TEST_ACTIVE_DEADLINE,
+        "restartPolicy": "Never"
+    }
+}
+
+def _gpu_test_pod_manifest(namespace: str, node_name: Optional[str] = None) -> Dict[str, Any]:
+    """Build the manifest of a GPU test pod with a fresh unique name."""
+    # The random suffix keeps pods created within the same second apart
+    pod_name = f"gpu-test-{int(time.time())}-{uuid.uuid4().hex[:5]}"
+    
+    # Copy the template's metadata and spec, which get per-pod fields
+    pod_json = {
+        **_GPU_TEST_POD_TEMPLATE,
+        "metadata": {
+            **_GPU_TEST_POD_TEMPLATE["metadata"],
+            "name": pod_name,
+            "namespace": namespace
+        },
+        "spec": dict(_GPU_TEST_POD_TEMPLATE["spec"])
+    }
+    
+    # Add node selector if a node name is provided
+    if node_name:
+        pod_json["spec"]["nodeSelector"] = {
+            "kubernetes.io/hostname": node_name
+        }
+    
+    return pod_json
+
 def create_gpu_test_pod(namespace: str, node_name: Optional[str] = None) -> str:
     """
     Create a test pod to validate GPU functionality.
@@ -761,60 +1094,365 @@ def create_gpu_test_pod(namespace: str, node_name: Optional[str] = None) -> str:
     Returns:
         The name of the created pod
     """
-    pod_name = f"gpu-test-{int(time.time())}"
+    if node_name and not node_cache.is_known(node_name):
+        logger.error(f"Failed to create GPU test pod: node {node_name} not found")
+        return ""
     
-    # Create a pod definition
-    pod_json = {
-        "apiVersion": "v1",
-        "kind": "Pod",
+    pod_json = _gpu_test_pod_manifest(namespace, node_name)
+    pod_name = pod_json["metadata"]["name"]
+    
+    # Create the pod
+    result = _oc_apply(pod_json)
+    
+    if result.returncode != 0:
+        logger.error(f"Failed to create GPU test pod: {result.stderr}")
+        return ""
+    
+    logger.info(f"Created GPU test pod: {pod_name}")
+    return pod_name
+
+def create_gpu_test_job(namespace: str, node_names: List[str]) -> str:
+    """
+    Create a single Job that runs nvidia-smi once on each of the given nodes.
+    
+    One Indexed Job with a completion per node replaces one pod creation
+    per node: the whole sweep is a single API call, and the scheduler
+    places the pods in parallel, one per node.
+    
+    Args:
+        namespace: The namespace where to create the job
+        node_names: Names of the nodes to run on
+        
+    Returns:
+        The name of the created job
+    """
+    job_name = f"gpu-test-{int(time.time())}-{uuid.uuid4().hex[:5]}"
+    
+    job_json = {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
         "metadata": {
-            "name": pod_name,
+            "name": job_name,
             "namespace": namespace
         },
         "spec": {
-            "containers": [{
-                "name": "gpu-test",
-                "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
-                "command": [
-                    "sh",
-                    "-c",
-                    "nvidia-smi && sleep 3600"
-                ],
-                "resources": {
-                    "limits": {
-                        "nvidia.com/gpu": "1"
+            "completionMode": "Indexed",
+            "completions": len(node_names),
+            "parallelism": len(node_names),
+            # A failing node fails the sweep rather than being retried elsewhere
+            "backoffLimit": 0,
+            "activeDeadlineSeconds": GPU_TEST_ACTIVE_DEADLINE,
+            # Remove the job and its pods shortly after the sweep finishes
+            "ttlSecondsAfterFinished": GPU_TEST_JOB_TTL,
+            "template": {
+                "metadata": {
+                    "labels": {
+                        "gpu-test-job": job_name
                     }
+                },
+                "spec": {
+                    "containers": [{
+                        "name": "gpu-test",
+                        "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
+                        "command": ["nvidia-smi"],
+                        "resources": {
+                            "limits": {
+                                "nvidia.com/gpu": "1"
+                            }
+                        }
+                    }],
+                    "affinity": {
+                        # Only the requested nodes...
+                        "nodeAffinity": {
+                            "requiredDuringSchedulingIgnoredDuringExecution": {
+                                "nodeSelectorTerms": [{
+                                    "matchExpressions": [{
+                                        "key": "kubernetes.io/hostname",
+                                        "operator": "In",
+                                        "values": list(node_names)
+                                    }]
+                                }]
+                            }
+                        },
+                        # ...and at most one of the job's pods on each
+                        "podAntiAffinity": {
+                            "requiredDuringSchedulingIgnoredDuringExecution": [{
+                                "labelSelector": {
+                                    "matchLabels": {
+                                        "gpu-test-job": job_name
+                                    }
+                                },
+                                "topologyKey": "kubernetes.io/hostname"
+                            }]
+                        }
+                    },
+                    "restartPolicy": "Never"
                 }
-            }],
-            "restartPolicy": "Never"
+            }
         }
     }
     
-    # Add node selector if a node name is provided
-    if node_name:
-        pod_json["spec"]["nodeSelector"] = {
-            "kubernetes.io/hostname": node_name
+    # Create the job
+    result = _oc_apply(job_json)
+    
+    if result.returncode != 0:
+        logger.error(f"Failed to create GPU test job: {result.stderr}")
+        return ""
+    
+    logger.info(f"Created GPU test job {job_name} for {len(node_names)} nodes")
+    return job_name
+
+# Seconds to wait for a GPU test pod to report nvidia-smi success
+TEST_POD_READY_TIMEOUT = 120
+
+def wait_for_gpu_test_pod(namespace: str, pod_name: str, timeout: int = TEST_POD_READY_TIMEOUT) -> bool:
+    """
+    Wait until a GPU test pod is Ready, i.e. nvidia-smi has run successfully in it.
+    
+    Args:
+        namespace: The namespace of the pod
+        pod_name: The name of the pod, as returned by create_gpu_test_pod
+        timeout: Seconds to wait before giving up
+        
+    Returns:
+        True if the pod became Ready in time, False otherwise
+    """
+    # oc wait watches the pod and returns as soon as the condition is met
+    result = subprocess.run(
+        ["oc", "wait", "--for=condition=Ready", f"pod/{pod_name}",
+         "-n", namespace, f"--timeout={timeout}s"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    
+    if result.returncode != 0:
+        logger.error(f"GPU test pod {pod_name} did not become ready: {result.stderr}")
+        return False
+    return True
+
+def wait_for_gpu_test_pods(namespace: str, pod_names: List[str],
+                           timeout: int = TEST_POD_READY_TIMEOUT) -> Dict[str, bool]:
+    """
+    Wait until several GPU test pods are Ready, with a single oc process.
+    
+    Args:
+        namespace: The namespace of the pods
+        pod_names: The names of the pods, as returned by create_gpu_test_pod(s)
+        timeout: Seconds to wait for each pod before giving up
+        
+    Returns:
+        Dictionary mapping each pod name to whether it became Ready in time
+    """
+    if not pod_names:
+        return {}
+    
+    # One oc wait watches all of the pods, rather than one oc call per pod
+    result = subprocess.run(
+        ["oc", "wait", "--for=condition=Ready", "-n", namespace, f"--timeout={timeout}s"]
+        + [f"pod/{pod_name}" for pod_name in pod_names],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    
+    # oc reports "pod/<name> condition met" for each pod that got there
+    ready = {
+        line.split()[0].partition("/")[2]
+        for line in result.stdout.splitlines()
+        if line.endswith("condition met")
+    }
+    if result.returncode != 0:
+        logger.error(f"Not all GPU test pods became ready: {result.stderr}")
+    return {pod_name: pod_name in ready for pod_name in pod_names}
+
+def create_gpu_test_pods(namespace: str, node_names: List[str]) -> List[str]:
+    """
+    Create one GPU test pod on each of the given nodes.
+    
+    Args:
+        namespace: The namespace where to create the pods
+        node_names: Names of the nodes to schedule a pod on
+        
+    Returns:
+        The names of the created pods, in the order of node_names; an
+        empty string for each node whose pod could not be created
+    """
+    unknown = [node_name for node_name in node_names if not node_cache.is_known(node_name)]
+    if unknown:
+        logger.error(f"Not creating GPU test pods on unknown nodes: {', '.join(unknown)}")
+    
+    # One manifest per known node; None keeps the unknown nodes' places
+    pods = [None if node_name in unknown else _gpu_test_pod_manifest(namespace, node_name)
+            for node_name in node_names]
+    manifests = [pod for pod in pods if pod is not None]
+    if not manifests:
+        return [""] * len(node_names)
+    
+    # Submit all manifests as one List, so a single oc process and API
+    # session creates the whole batch instead of one oc call per pod
+    result = _oc_apply({"apiVersion": "v1", "kind": "List", "items": manifests})
+    if result.returncode != 0:
+        logger.error(f"Failed to create some GPU test pods: {result.stderr}")
+    
+    # oc reports "pod/<name> serverside-applied" for each pod it applied
+    created = {
+        line.split()[0].partition("/")[2]
+        for line in result.stdout.splitlines()
+        if line.endswith(" serverside-applied")
+    }
+    logger.info(f"Created {len(created)} of {len(node_names)} GPU test pods")
+    return [
+        pod["metadata"]["name"] if pod is not None and pod["metadata"]["name"] in created else ""
+        for pod in pods
+    ]
+
+# Resident pods that GPU checks exec into instead of creating a pod each time
+GPU_AGENT_NAME = "gpu-validator-agent"
+
+def _gpu_agent_daemonset(namespace: str) -> Dict[str, Any]:
+    """Build the DaemonSet that keeps an idle agent pod on every GPU node."""
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "DaemonSet",
+        "metadata": {
+            "name": GPU_AGENT_NAME,
+            "namespace": namespace
+        },
+        "spec": {
+            "selector": {
+                "matchLabels": {
+                    "app": GPU_AGENT_NAME
+                }
+            },
+            "template": {
+                "metadata": {
+                    "labels": {
+                        "app": GPU_AGENT_NAME
+                    }
+                },
+                "spec": {
+                    "nodeSelector": {
+                        "nvidia.com/gpu.present": "true"
+                    },
+                    "containers": [{
+                        "name": "agent",
+                        "image": "nvidia/cuda:11.8.0-base-ubuntu22.04",
+                        "command": ["sleep", "infinity"],
+                        # See the node's GPUs without allocating one, so the
+                        # idle agent does not keep a GPU from real workloads.
+                        # This relies on the NVIDIA container runtime honouring
+                        # the variable and bypasses device-plugin accounting,
+                        # hence exec_gpu_test only uses the agent on request
+                        "env": [{
+                            "name": "NVIDIA_VISIBLE_DEVICES",
+                            "value": "all"
+                        }]
+                    }]
+                }
+            }
         }
+    }
+
+def deploy_gpu_validator_agent(namespace: str) -> bool:
+    """
+    Deploy (or update) the GPU validator agent DaemonSet.
+    
+    Args:
+        namespace: The namespace where to run the agent pods
+        
+    Returns:
+        True if the DaemonSet was applied, False otherwise
+    """
+    result = _oc_apply(_gpu_agent_daemonset(namespace))
+    if result.returncode != 0:
+        logger.error(f"Failed to deploy {GPU_AGENT_NAME}: {result.stderr}")
+        return False
+    return True
+
+def exec_gpu_test(namespace: str, node_name: str, use_agent: bool = False) -> bool:
+    """
+    Check that a node's GPUs work by creating a GPU test pod on it, which
+    requests an nvidia.com/gpu and waits for nvidia-smi to succeed.
     
-    # Create a temporary file for the pod definition
-    temp_file = f"/tmp/gpu-test-pod-{pod_name}.json"
-    with open(temp_file, "w") as f:
-        json.dump(pod_json, f)
+    With use_agent, nvidia-smi is run in the node's resident agent pod
+    instead, falling back to a test pod if none is running there. That is
+    much faster but a weaker check: the agent sees the GPUs through
+    NVIDIA_VISIBLE_DEVICES without requesting one, so it shows the driver
+    works, not that the device plugin can hand a GPU to a pod.
     
-    # Create the pod
-    stdout, stderr, return_code = subprocess.run(
-        ["oc", "create", "-f", temp_file],
+    Args:
+        namespace: The namespace of the test and agent pods
+        node_name: The name of the node to check
+        use_agent: Run nvidia-smi in the agent pod when there is one
+        
+    Returns:
+        True if nvidia-smi succeeded on the node, False otherwise
+    """
+    agent_pods = []
+    if use_agent:
+        # Find the node's running agent pod
+        result = subprocess.run(
+            ["oc", "get", "pods", "-n", namespace, "-l", f"app={GPU_AGENT_NAME}",
+             f"--field-selector=spec.nodeName={node_name},status.phase=Running",
+             f"--request-timeout={OC_REQUEST_TIMEOUT}", "-o", "name"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+        agent_pods = result.stdout.split() if result.returncode == 0 else []
+    
+    if agent_pods:
+        result = subprocess.run(
+            ["oc", "exec", "-n", namespace, agent_pods[0], "--", "nvidia-smi", "-L"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+        if result.returncode != 0:
+            logger.error(f"nvidia-smi failed on node {node_name}: {result.stderr}")
+            return False
+        return True
+    
+    # Cold path: schedule a test pod, wait for nvidia-smi to succeed in it
+    # and clean it up again
+    if use_agent:
+        logger.info(f"No {GPU_AGENT_NAME} pod on node {node_name}, creating a GPU test pod")
+    pod_name = create_gpu_test_pod(namespace, node_name)
+    if not pod_name:
+        return False
+    ready = wait_for_gpu_test_pod(namespace, pod_name)
+    subprocess.run(
+        ["oc", "delete", "pod", pod_name, "-n", namespace, "--wait=false",
+         f"--request-timeout={OC_REQUEST_TIMEOUT}"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         universal_newlines=True
     )
+    return ready
+
+# Upper bound on nodes checked by exec_gpu_tests at the same time
+MAX_CONCURRENT_NODE_TESTS = 10
+
+def exec_gpu_tests(namespace: str, node_names: List[str], use_agent: bool = False) -> Dict[str, bool]:
+    """
+    Run exec_gpu_test on several nodes.
     
-    if return_code != 0:
-        logger.error(f"Failed to create GPU test pod: {stderr}")
-        return ""
+    Args:
+        namespace: The namespace of the test and agent pods
+        node_names: Names of the nodes to check
+        use_agent: Passed on to exec_gpu_test
+        
+    Returns:
+        Dictionary mapping each node name to whether nvidia-smi succeeded on it
+    """
+    if not node_names:
+        return {}
     
-    logger.info(f"Created GPU test pod: {pod_name}")
-    return pod_name
+    # Each check mostly waits on the cluster, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_NODE_TESTS, len(node_names))) as executor:
+        results = executor.map(lambda node_name: exec_gpu_test(namespace, node_name, use_agent), node_names)
+        return dict(zip(node_names, results))
 
 if __name__ == "__main__":
     print("GPU Validation Module")
@@ -6,45 +6,380 @@ Tests use mocking to simulate OpenShift command outputs and responses.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, DEFAULT
 import json
 import io
+import contextlib
 import sys
 import os
-import tempfile
+import subprocess
+import threading
 
 # Add parent directory to path to import the gpu_validator module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import module to test
-from gpu_validator import GPUValidator, validate_gpu_setup, test_gpu_workload
+# Import module to test. test_gpu_workload is reached through the module so
+# that pytest does not collect the imported function as a test of its own.
+import gpu_validator
+from gpu_validator import (GPUValidator, NodeCache, validate_gpu_setup,
+                           create_gpu_test_pod, create_gpu_test_pods, create_gpu_test_job,
+                           wait_for_gpu_test_pod, wait_for_gpu_test_pods,
+                           exec_gpu_test, exec_gpu_tests, _json_dumps)
+
+# Commands the validator is expected to run, in the form run_command gets them
+OC_WHOAMI = ["oc", "whoami"]
+OC_GET_CSV = ["oc", "get", "csv", "-n", "nvidia-gpu-operator", "-o", "json"]
+OC_GET_PROBLEM_PODS = ["oc", "get", "pods", "-n", "nvidia-gpu-operator", "--field-selector=status.phase!=Running", "-o", "json"]
+OC_GET_NODES = ["oc", "get", "nodes", "-o", "json"]
+OC_GET_DAEMONSETS = ["oc", "get", "daemonset", "-n", "nvidia-gpu-operator", "-o", "json"]
+
+# The cluster-wide checks run by run_all_validations before the per-node ones
+CLUSTER_CHECKS = (
+    "validate_oc_connection",
+    "validate_gpu_operator_installation",
+    "validate_gpu_operator_pods",
+    "validate_node_gpu_status",
+    "validate_gpu_feature_discovery",
+    "validate_driver_daemonset",
+)
+
+# Mocked `oc get ... -o json` output, serialized once for the whole module with
+# the validator's own serializer (orjson when it is installed)
+EMPTY_LIST_JSON = '{"items": []}'
+
+CSV_JSON_GPU_OPERATOR = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "gpu-operator-certified.v1.10.1"},
+            "spec": {"version": "1.10.1"}
+        }
+    ]
+})
 
-class TestGPUValidator(unittest.TestCase):
-    """Test cases for the GPUValidator class."""
+CSV_JSON_OTHER_OPERATOR = _json_dumps({"items": [{"metadata": {"name": "other-operator"}}]})
+
+POD_LIST_JSON_ALL_RUNNING = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "nvidia-driver-daemonset-1234"},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [
+                    {"ready": True}
+                ]
+            }
+        },
+        {
+            "metadata": {"name": "nvidia-device-plugin-daemonset-5678"},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [
+                    {"ready": True}
+                ]
+            }
+        }
+    ]
+})
+
+POD_LIST_JSON_ONE_FAILING = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "nvidia-driver-daemonset-1234"},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [
+                    {"ready": True}
+                ]
+            }
+        },
+        {
+            "metadata": {"name": "nvidia-device-plugin-daemonset-5678"},
+            "status": {
+                "phase": "CrashLoopBackOff",
+                "containerStatuses": [
+                    {
+                        "ready": False,
+                        "state": {
+                            "waiting": {
+                                "reason": "CrashLoopBackOff",
+                                "message": "Container failed to start"
+                            }
+                        }
+                    }
+                ]
+            }
+        }
+    ]
+})
+
+POD_LIST_JSON_OVER_REPORT_CAP = _json_dumps({
+    "items": [
+        {"metadata": {"name": f"nvidia-pod-{i}"}, "status": {"phase": "Pending"}}
+        for i in range(GPUValidator.MAX_REPORTED_PODS + 5)
+    ]
+})
+
+NODE_LIST_JSON_ONE_GPU_NODE = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "node1.example.com"},
+            "status": {
+                "capacity": {
+                    "nvidia.com/gpu": "2"
+                }
+            }
+        },
+        {
+            "metadata": {"name": "node2.example.com"},
+            "status": {
+                "capacity": {
+                    "cpu": "8",
+                    "memory": "32Gi"
+                }
+            }
+        }
+    ]
+})
+
+NODE_LIST_JSON_NO_GPU_NODES = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "node1.example.com"},
+            "status": {
+                "capacity": {
+                    "cpu": "8",
+                    "memory": "32Gi"
+                }
+            }
+        },
+        {
+            "metadata": {"name": "node2.example.com"},
+            "status": {
+                "capacity": {
+                    "cpu": "8",
+                    "memory": "32Gi"
+                }
+            }
+        }
+    ]
+})
+
+NODE_LIST_JSON_GPU_QUANTITIES = _json_dumps({
+    "items": [
+        {"metadata": {"name": "node1.example.com"}, "status": {"capacity": {"nvidia.com/gpu": "1k"}}},
+        {"metadata": {"name": "node2.example.com"}, "status": {"capacity": {"nvidia.com/gpu": "0"}}}
+    ]
+})
+
+NODE_LIST_JSON_LABELLED_GPU_NODE = _json_dumps({
+    "items": [
+        {
+            "metadata": {
+                "name": "node1.example.com",
+                "labels": {
+                    "feature.node.kubernetes.io/pci-10de.present": "true",
+                    "nvidia.com/gpu.present": "true",
+                    "nvidia.com/gpu.count": "2",
+                    "nvidia.com/gpu.product": "Tesla-V100",
+                    "nvidia.com/gpu.memory": "32GB"
+                }
+            },
+            "status": {
+                "capacity": {
+                    "nvidia.com/gpu": "2"
+                }
+            }
+        }
+    ]
+})
+
+NODE_LIST_JSON_MISSING_LABELS = _json_dumps({
+    "items": [
+        {
+            "metadata": {
+                "name": "node1.example.com",
+                "labels": {
+                    "feature.node.kubernetes.io/pci-10de.present": "true",
+                    "nvidia.com/gpu.count": "2"
+                    # Missing some labels
+                }
+            },
+            "status": {
+                "capacity": {
+                    "nvidia.com/gpu": "2"
+                }
+            }
+        }
+    ]
+})
+
+NODE_LIST_JSON_NO_VENDOR_LABEL = _json_dumps({
+    "items": [
+        {
+            "metadata": {
+                "name": "node1.example.com",
+                "labels": {"nvidia.com/gpu.present": "true"}
+            },
+            "status": {
+                "capacity": {
+                    "nvidia.com/gpu": "1"
+                }
+            }
+        }
+    ]
+})
+
+NODE_LIST_JSON_UNLABELLED_GPU_NODE = _json_dumps({
+    "items": [
+        {"metadata": {"name": "node2.example.com"}, "status": {"capacity": {"nvidia.com/gpu": "1"}}}
+    ]
+})
+
+NODE_LIST_JSON_LABELLED_AND_UNLABELLED = _json_dumps({
+    "items": json.loads(NODE_LIST_JSON_LABELLED_GPU_NODE)["items"]
+    + json.loads(NODE_LIST_JSON_UNLABELLED_GPU_NODE)["items"]
+})
+
+DAEMONSET_JSON_READY = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "nvidia-driver-daemonset"},
+            "status": {
+                "desiredNumberScheduled": 2,
+                "currentNumberScheduled": 2,
+                "numberReady": 2
+            }
+        }
+    ]
+})
+
+DAEMONSET_JSON_NOT_READY = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "nvidia-driver-daemonset"},
+            "status": {
+                "desiredNumberScheduled": 2,
+                "currentNumberScheduled": 2,
+                "numberReady": 1
+            }
+        }
+    ]
+})
+
+DAEMONSET_JSON_OTHER = _json_dumps({
+    "items": [
+        {
+            "metadata": {"name": "other-daemonset"},
+            "status": {
+                "desiredNumberScheduled": 2,
+                "currentNumberScheduled": 2,
+                "numberReady": 2
+            }
+        }
+    ]
+})
+
+WORKLOAD_POD_JSON_RUNNING = _json_dumps({
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [
+            {"ready": True}
+        ]
+    },
+    "spec": {
+        "containers": [
+            {
+                "resources": {
+                    "limits": {
+                        "nvidia.com/gpu": "1"
+                    },
+                    "requests": {
+                        "nvidia.com/gpu": "1"
+                    }
+                }
+            }
+        ]
+    }
+})
+
+WORKLOAD_POD_JSON_PENDING = _json_dumps({
+    "status": {
+        "phase": "Pending",
+        "containerStatuses": [
+            {
+                "ready": False,
+                "state": {
+                    "waiting": {
+                        "reason": "ContainerCreating",
+                        "message": "Container is being created"
+                    }
+                }
+            }
+        ]
+    },
+    "spec": {
+        "containers": [
+            {
+                "resources": {
+                    "limits": {
+                        "nvidia.com/gpu": "1"
+                    },
+                    "requests": {
+                        "nvidia.com/gpu": "1"
+                    }
+                }
+            }
+        ]
+    }
+})
+
+WORKLOAD_POD_JSON_NO_GPU_REQUEST = _json_dumps({
+    "status": {
+        "phase": "Running",
+        "containerStatuses": [
+            {"ready": True}
+        ]
+    },
+    "spec": {
+        "containers": [
+            {
+                "resources": {
+                    "limits": {},
+                    "requests": {}
+                }
+            }
+        ]
+    }
+})
+
+NODE_LIST_JSON_MIXED = _json_dumps({
+    "items": [
+        {"metadata": {"name": "gpu1"}, "status": {"capacity": {"nvidia.com/gpu": "1"}}},
+        {"metadata": {"name": "cpu1"}, "status": {"capacity": {"cpu": "8"}}},
+        {"metadata": {"name": "gpu2"}, "status": {"capacity": {"nvidia.com/gpu": "4"}}}
+    ]
+})
+
+class TestRunCommand(unittest.TestCase):
+    """Test cases for GPUValidator.run_command."""
 
     def setUp(self):
         """Set up test fixtures."""
         self.validator = GPUValidator()
-        # Create a temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir)
 
-    @patch('subprocess.Popen')
-    def test_run_command(self, mock_popen):
+    def test_run_command(self):
         """Test the run_command method."""
-        # Setup mock process
-        process_mock = MagicMock()
-        process_mock.communicate.return_value = ("sample output", "sample error")
-        process_mock.returncode = 0
-        mock_popen.return_value = process_mock
+        # Setup mock process: a plain stub is all run_command needs
+        class FinishedProcess:
+            returncode = 0
+
+            def communicate(self, input=None):
+                return "sample output", "sample error"
+
+        mock_popen = MagicMock(return_value=FinishedProcess())
 
         # Run the method
-        stdout, stderr, return_code = self.validator.run_command(["test", "command"])
+        stdout, stderr, return_code = self.validator.run_command(["test", "command"], _popen=mock_popen)
 
         # Assertions
         mock_popen.assert_called_once_with(
@@ -57,582 +392,372 @@ class TestGPUValidator(unittest.TestCase):
         self.assertEqual(stderr, "sample error")
         self.assertEqual(return_code, 0)
 
-    @patch('subprocess.Popen')
-    def test_run_command_exception(self, mock_popen):
+    def test_run_command_exception(self):
         """Test the run_command method when an exception occurs."""
-        # Setup mock process to raise an exception
-        mock_popen.side_effect = Exception("Command failed")
+        # Setup a process factory that raises an exception
+        def failing_popen(*args, **kwargs):
+            raise Exception("Command failed")
 
         # Run the method
-        stdout, stderr, return_code = self.validator.run_command(["test", "command"])
+        stdout, stderr, return_code = self.validator.run_command(["test", "command"], _popen=failing_popen)
 
         # Assertions
         self.assertEqual(stdout, "")
         self.assertEqual(stderr, "Command failed")
         self.assertEqual(return_code, 1)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_oc_connection_success(self, mock_run_command):
+class TestGPUValidator(unittest.TestCase):
+    """Test cases for the GPUValidator class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # The tests only mock commands, so no files or directories are needed
+        self.validator = GPUValidator()
+        # Every test talks to the cluster through one mocked run_command
+        patcher = patch.object(GPUValidator, 'run_command')
+        self.mock_run_command = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _assert_status(self, key, status):
+        """Assert that the validation recorded under key has the given status."""
+        self.assertEqual(self.validator.validation_results[key]["status"], status)
+
+    def test_validate_oc_connection_success(self):
         """Test validate_oc_connection with successful connection."""
         # Setup mock command output
-        mock_run_command.return_value = ("test-user", "", 0)
+        self.mock_run_command.return_value = ("test-user", "", 0)
 
         # Run the method
         result = self.validator.validate_oc_connection()
 
         # Assertions
-        mock_run_command.assert_called_once_with(["oc", "whoami"])
+        self.mock_run_command.assert_called_once_with(OC_WHOAMI)
         self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["oc_connection"]["status"], "passed")
+        self._assert_status("oc_connection", "passed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_oc_connection_failure(self, mock_run_command):
+    def test_validate_oc_connection_failure(self):
         """Test validate_oc_connection with failed connection."""
         # Setup mock command output
-        mock_run_command.return_value = ("", "error: you must be logged in", 1)
+        self.mock_run_command.return_value = ("", "error: you must be logged in", 1)
 
         # Run the method
         result = self.validator.validate_oc_connection()
 
         # Assertions
-        mock_run_command.assert_called_once_with(["oc", "whoami"])
+        self.mock_run_command.assert_called_once_with(OC_WHOAMI)
         self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["oc_connection"]["status"], "failed")
+        self._assert_status("oc_connection", "failed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_installation_success(self, mock_run_command):
+    def test_validate_gpu_operator_installation_success(self):
         """Test validate_gpu_operator_installation with successful installation."""
         # Setup mock command output
-        csv_data = {
-            "items": [
-                {
-                    "metadata": {"name": "gpu-operator-certified.v1.10.1"},
-                    "spec": {"version": "1.10.1"}
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(csv_data), "", 0)
+        self.mock_run_command.return_value = (CSV_JSON_GPU_OPERATOR, "", 0)
 
         # Run the method
         result = self.validator.validate_gpu_operator_installation()
 
         # Assertions
-        mock_run_command.assert_called_once_with([
-            "oc", "get", "csv", "-n", "nvidia-gpu-operator", "-o", "json"
-        ])
+        self.mock_run_command.assert_called_once_with(OC_GET_CSV)
         self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator"]["status"], "passed")
+        self._assert_status("gpu_operator", "passed")
         self.assertEqual(self.validator.validation_results["gpu_operator"]["details"]["version"], "1.10.1")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_installation_not_found(self, mock_run_command):
-        """Test validate_gpu_operator_installation when operator not found."""
-        # Setup mock command output
-        csv_data = {"items": [{"metadata": {"name": "other-operator"}}]}
-        mock_run_command.return_value = (json.dumps(csv_data), "", 0)
-
-        # Run the method
-        result = self.validator.validate_gpu_operator_installation()
-
-        # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator"]["status"], "failed")
-
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_installation_command_error(self, mock_run_command):
-        """Test validate_gpu_operator_installation with command error."""
-        # Setup mock command output
-        mock_run_command.return_value = ("", "error: namespace not found", 1)
+    def test_validate_gpu_operator_installation_failures(self):
+        """Test validate_gpu_operator_installation when the operator cannot be confirmed."""
+        cases = {
+            "not_found": (CSV_JSON_OTHER_OPERATOR, "", 0),
+            "command_error": ("", "error: namespace not found", 1),
+            "json_error": ("invalid json", "", 0),
+        }
+        for case, output in cases.items():
+            with self.subTest(case):
+                # Setup mock command output; a fresh validator has no cached list
+                self.validator = GPUValidator()
+                self.mock_run_command.return_value = output
 
-        # Run the method
-        result = self.validator.validate_gpu_operator_installation()
+                # Run the method
+                result = self.validator.validate_gpu_operator_installation()
 
-        # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator"]["status"], "failed")
+                # Assertions
+                self.assertFalse(result)
+                self._assert_status("gpu_operator", "failed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_installation_json_error(self, mock_run_command):
-        """Test validate_gpu_operator_installation with invalid JSON."""
+    def test_validate_gpu_operator_pods_all_running(self):
+        """Test validate_gpu_operator_pods with all pods running."""
         # Setup mock command output
-        mock_run_command.return_value = ("invalid json", "", 0)
+        self.mock_run_command.return_value = (POD_LIST_JSON_ALL_RUNNING, "", 0)
 
         # Run the method
-        result = self.validator.validate_gpu_operator_installation()
+        result = self.validator.validate_gpu_operator_pods()
 
         # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator"]["status"], "failed")
+        self.mock_run_command.assert_called_once_with(OC_GET_PROBLEM_PODS)
+        self.assertTrue(result)
+        self._assert_status("gpu_operator_pods", "passed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_pods_all_running(self, mock_run_command):
-        """Test validate_gpu_operator_pods with all pods running."""
+    def test_validate_gpu_operator_pods_some_failing(self):
+        """Test validate_gpu_operator_pods with some pods failing."""
         # Setup mock command output
-        pod_data = {
-            "items": [
-                {
-                    "metadata": {"name": "nvidia-driver-daemonset-1234"},
-                    "status": {
-                        "phase": "Running",
-                        "containerStatuses": [
-                            {"ready": True}
-                        ]
-                    }
-                },
-                {
-                    "metadata": {"name": "nvidia-device-plugin-daemonset-5678"},
-                    "status": {
-                        "phase": "Running",
-                        "containerStatuses": [
-                            {"ready": True}
-                        ]
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(pod_data), "", 0)
+        self.mock_run_command.return_value = (POD_LIST_JSON_ONE_FAILING, "", 0)
 
         # Run the method
         result = self.validator.validate_gpu_operator_pods()
 
         # Assertions
-        mock_run_command.assert_called_once_with([
-            "oc", "get", "pods", "-n", "nvidia-gpu-operator", "-o", "json"
-        ])
-        self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator_pods"]["status"], "passed")
+        self.assertFalse(result)
+        self._assert_status("gpu_operator_pods", "failed")
+        self.assertEqual(len(self.validator.validation_results["gpu_operator_pods"]["details"]), 1)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_operator_pods_some_failing(self, mock_run_command):
-        """Test validate_gpu_operator_pods with some pods failing."""
+    def test_validate_gpu_operator_pods_report_capped(self):
+        """Test validate_gpu_operator_pods caps the number of reported pods."""
         # Setup mock command output
-        pod_data = {
-            "items": [
-                {
-                    "metadata": {"name": "nvidia-driver-daemonset-1234"},
-                    "status": {
-                        "phase": "Running",
-                        "containerStatuses": [
-                            {"ready": True}
-                        ]
-                    }
-                },
-                {
-                    "metadata": {"name": "nvidia-device-plugin-daemonset-5678"},
-                    "status": {
-                        "phase": "CrashLoopBackOff",
-                        "containerStatuses": [
-                            {
-                                "ready": False,
-                                "state": {
-                                    "waiting": {
-                                        "reason": "CrashLoopBackOff",
-                                        "message": "Container failed to start"
-                                    }
-                                }
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(pod_data), "", 0)
+        self.mock_run_command.return_value = (POD_LIST_JSON_OVER_REPORT_CAP, "", 0)
 
         # Run the method
         result = self.validator.validate_gpu_operator_pods()
 
         # Assertions
         self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_operator_pods"]["status"], "failed")
-        self.assertEqual(len(self.validator.validation_results["gpu_operator_pods"]["details"]), 1)
+        pods_result = self.validator.validation_results["gpu_operator_pods"]
+        self.assertEqual(len(pods_result["details"]), GPUValidator.MAX_REPORTED_PODS)
+        self.assertEqual(pods_result["message"], f"Found {GPUValidator.MAX_REPORTED_PODS}+ problematic pods")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_node_gpu_status_gpus_found(self, mock_run_command):
+    def test_validate_node_gpu_status_gpus_found(self):
         """Test validate_node_gpu_status with GPUs found."""
         # Setup mock command output
-        node_data = {
-            "items": [
-                {
-                    "metadata": {"name": "node1.example.com"},
-                    "status": {
-                        "capacity": {
-                            "nvidia.com/gpu": "2"
-                        }
-                    }
-                },
-                {
-                    "metadata": {"name": "node2.example.com"},
-                    "status": {
-                        "capacity": {
-                            "cpu": "8",
-                            "memory": "32Gi"
-                        }
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(node_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_ONE_GPU_NODE, "", 0)
 
         # Run the method
         result = self.validator.validate_node_gpu_status()
 
         # Assertions
-        mock_run_command.assert_called_once_with([
-            "oc", "get", "nodes", "-o", "json"
-        ])
+        self.mock_run_command.assert_called_once_with(OC_GET_NODES)
         self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["node_gpu_status"]["status"], "passed")
+        self._assert_status("node_gpu_status", "passed")
         self.assertEqual(len(self.validator.validation_results["node_gpu_status"]["details"]["nodes_with_gpus"]), 1)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_node_gpu_status_no_gpus(self, mock_run_command):
+    def test_validate_node_gpu_status_no_gpus(self):
         """Test validate_node_gpu_status with no GPUs found."""
         # Setup mock command output
-        node_data = {
-            "items": [
-                {
-                    "metadata": {"name": "node1.example.com"},
-                    "status": {
-                        "capacity": {
-                            "cpu": "8",
-                            "memory": "32Gi"
-                        }
-                    }
-                },
-                {
-                    "metadata": {"name": "node2.example.com"},
-                    "status": {
-                        "capacity": {
-                            "cpu": "8",
-                            "memory": "32Gi"
-                        }
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(node_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_NO_GPU_NODES, "", 0)
 
         # Run the method
         result = self.validator.validate_node_gpu_status()
 
         # Assertions
         self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["node_gpu_status"]["status"], "failed")
+        self._assert_status("node_gpu_status", "failed")
         self.assertEqual(len(self.validator.validation_results["node_gpu_status"]["details"]["nodes_without_gpus"]), 2)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_feature_discovery_success(self, mock_run_command):
+    def test_validate_node_gpu_status_quantity_suffix(self):
+        """Test validate_node_gpu_status with GPU counts written as quantities."""
+        # Setup mock command output
+        self.mock_run_command.return_value = (NODE_LIST_JSON_GPU_QUANTITIES, "", 0)
+
+        # Run the method
+        result = self.validator.validate_node_gpu_status()
+
+        # Assertions
+        self.assertTrue(result)
+        details = self.validator.validation_results["node_gpu_status"]["details"]
+        self.assertEqual(details["nodes_with_gpus"], [{"name": "node1.example.com", "gpu_count": "1k"}])
+        self.assertEqual(details["nodes_without_gpus"], ["node2.example.com"])
+
+    def test_validate_gpu_feature_discovery_success(self):
         """Test validate_gpu_feature_discovery with successful discovery."""
         # Setup mock command output
-        node_data = {
-            "items": [
-                {
-                    "metadata": {
-                        "name": "node1.example.com",
-                        "labels": {
-                            "feature.node.kubernetes.io/pci-10de.present": "true",
-                            "nvidia.com/gpu.present": "true",
-                            "nvidia.com/gpu.count": "2",
-                            "nvidia.com/gpu.product": "Tesla-V100",
-                            "nvidia.com/gpu.memory": "32GB"
-                        }
-                    },
-                    "status": {
-                        "capacity": {
-                            "nvidia.com/gpu": "2"
-                        }
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(node_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_LABELLED_GPU_NODE, "", 0)
 
         # Run the method
         result = self.validator.validate_gpu_feature_discovery()
 
         # Assertions
-        mock_run_command.assert_called_once_with([
-            "oc", "get", "nodes", "-o", "json"
-        ])
+        self.mock_run_command.assert_called_once_with(OC_GET_NODES)
         self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["gpu_feature_discovery"]["status"], "passed")
+        self._assert_status("gpu_feature_discovery", "passed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_feature_discovery_missing_labels(self, mock_run_command):
+    def test_validate_gpu_feature_discovery_missing_labels(self):
         """Test validate_gpu_feature_discovery with missing labels."""
         # Setup mock command output
-        node_data = {
-            "items": [
-                {
-                    "metadata": {
-                        "name": "node1.example.com",
-                        "labels": {
-                            "feature.node.kubernetes.io/pci-10de.present": "true",
-                            "nvidia.com/gpu.count": "2"
-                            # Missing some labels
-                        }
-                    },
-                    "status": {
-                        "capacity": {
-                            "nvidia.com/gpu": "2"
-                        }
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(node_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_MISSING_LABELS, "", 0)
 
         # Run the method
         result = self.validator.validate_gpu_feature_discovery()
 
         # Assertions
         self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_feature_discovery"]["status"], "failed")
+        self._assert_status("gpu_feature_discovery", "failed")
         self.assertEqual(len(self.validator.validation_results["gpu_feature_discovery"]["details"]["nodes_with_missing_labels"]), 1)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_driver_daemonset_success(self, mock_run_command):
-        """Test validate_driver_daemonset with successful driver installation."""
+    def test_validate_gpu_feature_discovery_vendor_label_missing(self):
+        """Test validate_gpu_feature_discovery with a GPU node lacking the vendor label."""
         # Setup mock command output
-        ds_data = {
-            "items": [
-                {
-                    "metadata": {"name": "nvidia-driver-daemonset"},
-                    "status": {
-                        "desiredNumberScheduled": 2,
-                        "currentNumberScheduled": 2,
-                        "numberReady": 2
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(ds_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_NO_VENDOR_LABEL, "", 0)
 
         # Run the method
-        result = self.validator.validate_driver_daemonset()
+        result = self.validator.validate_gpu_feature_discovery()
 
         # Assertions
-        mock_run_command.assert_called_once_with([
-            "oc", "get", "daemonset", "-n", "nvidia-gpu-operator", "-o", "json"
-        ])
-        self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["driver_daemonset"]["status"], "passed")
+        self.assertFalse(result)
+        missing = self.validator.validation_results["gpu_feature_discovery"]["details"]["nodes_with_missing_labels"]
+        self.assertIn("feature.node.kubernetes.io/pci-10de.present", missing[0]["missing_labels"])
+        self.mock_run_command.assert_called_once_with(OC_GET_NODES)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_driver_daemonset_not_ready(self, mock_run_command):
-        """Test validate_driver_daemonset with not ready driver."""
+    def test_validate_gpu_feature_discovery_mixed_labels(self):
+        """Test that an unlabelled GPU node is reported when another node is labelled."""
         # Setup mock command output
-        ds_data = {
-            "items": [
-                {
-                    "metadata": {"name": "nvidia-driver-daemonset"},
-                    "status": {
-                        "desiredNumberScheduled": 2,
-                        "currentNumberScheduled": 2,
-                        "numberReady": 1
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(ds_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_LABELLED_AND_UNLABELLED, "", 0)
 
         # Run the method
-        result = self.validator.validate_driver_daemonset()
+        result = self.validator.validate_gpu_feature_discovery()
 
         # Assertions
         self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["driver_daemonset"]["status"], "failed")
+        self.mock_run_command.assert_called_once_with(OC_GET_NODES)
+        details = self.validator.validation_results["gpu_feature_discovery"]["details"]
+        self.assertEqual([node["name"] for node in details["nodes_with_complete_labels"]], ["node1.example.com"])
+        self.assertEqual([node["name"] for node in details["nodes_with_missing_labels"]], ["node2.example.com"])
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_driver_daemonset_not_found(self, mock_run_command):
-        """Test validate_driver_daemonset with driver not found."""
+    def test_node_validations_share_node_list(self):
+        """Test that node-based validations fetch the node list only once."""
         # Setup mock command output
-        ds_data = {
-            "items": [
-                {
-                    "metadata": {"name": "other-daemonset"},
-                    "status": {
-                        "desiredNumberScheduled": 2,
-                        "currentNumberScheduled": 2,
-                        "numberReady": 2
-                    }
-                }
-            ]
-        }
-        mock_run_command.return_value = (json.dumps(ds_data), "", 0)
+        self.mock_run_command.return_value = (NODE_LIST_JSON_LABELLED_GPU_NODE, "", 0)
 
-        # Run the method
-        result = self.validator.validate_driver_daemonset()
+        # Run the methods
+        self.assertTrue(self.validator.validate_node_gpu_status())
+        self.assertTrue(self.validator.validate_gpu_feature_discovery())
 
         # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["driver_daemonset"]["status"], "failed")
+        self.mock_run_command.assert_called_once_with(OC_GET_NODES)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_workload_success(self, mock_run_command):
-        """Test validate_gpu_workload with successful workload."""
-        # Setup mock command output for pod info
-        pod_data = {
-            "status": {
-                "phase": "Running",
-                "containerStatuses": [
-                    {"ready": True}
-                ]
-            },
-            "spec": {
-                "containers": [
-                    {
-                        "resources": {
-                            "limits": {
-                                "nvidia.com/gpu": "1"
-                            },
-                            "requests": {
-                                "nvidia.com/gpu": "1"
-                            }
-                        }
-                    }
-                ]
-            }
-        }
-        # Setup mock command output for pod logs
-        pod_logs = "NVIDIA-SMI 470.57.02    Driver Version: 470.57.02    CUDA Version: 11.4"
-        
-        # Use side_effect to return different values for different calls
-        mock_run_command.side_effect = [
-            (json.dumps(pod_data), "", 0),  # First call: get pod info
-            (pod_logs, "", 0)               # Second call: get pod logs
+    @patch.object(GPUValidator, 'validate_nvidia_smi_on_node')
+    def test_run_all_validations_reuse_between_runs(self, mock_smi):
+        """Test that resource lists are kept across runs only when asked to."""
+        # Setup mock command output
+        self.mock_run_command.return_value = (EMPTY_LIST_JSON, "", 0)
+
+        # Run the method twice, then twice more with reuse enabled
+        self.validator.run_all_validations()
+        calls_per_run = self.mock_run_command.call_count
+        self.validator.run_all_validations()
+        self.assertEqual(self.mock_run_command.call_count, 2 * calls_per_run)
+
+        validator = GPUValidator(reuse_between_runs=True)
+        validator.run_all_validations()
+        self.mock_run_command.reset_mock()
+        validator.run_all_validations()
+
+        # Assertions: the second run lists nothing again
+        self.mock_run_command.assert_called_once_with(OC_WHOAMI)
+
+    def test_direct_checks_list_fresh_state(self):
+        """Test that checks called directly re-list unless reuse is enabled."""
+        # Setup mock command outputs: the failing pod has recovered by the second poll
+        self.mock_run_command.side_effect = [
+            (POD_LIST_JSON_ONE_FAILING, "", 0),
+            (EMPTY_LIST_JSON, "", 0)
         ]
 
-        # Run the method
-        result = self.validator.validate_gpu_workload("test-namespace", "test-pod")
+        # Run the method twice, as a caller waiting for the pods would
+        self.assertFalse(self.validator.validate_gpu_operator_pods())
+        self.assertTrue(self.validator.validate_gpu_operator_pods())
+
+        # With reuse enabled the second poll is served from the cache
+        validator = GPUValidator(reuse_between_runs=True)
+        self.mock_run_command.reset_mock()
+        self.mock_run_command.side_effect = None
+        self.mock_run_command.return_value = (EMPTY_LIST_JSON, "", 0)
+        validator.validate_gpu_operator_pods()
+        validator.validate_gpu_operator_pods()
 
         # Assertions
-        self.assertTrue(result)
-        self.assertEqual(self.validator.validation_results["gpu_workload"]["status"], "passed")
+        self.mock_run_command.assert_called_once_with(OC_GET_PROBLEM_PODS)
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_workload_not_running(self, mock_run_command):
-        """Test validate_gpu_workload with non-running workload."""
+    def test_validate_driver_daemonset_success(self):
+        """Test validate_driver_daemonset with successful driver installation."""
         # Setup mock command output
-        pod_data = {
-            "status": {
-                "phase": "Pending",
-                "containerStatuses": [
-                    {
-                        "ready": False,
-                        "state": {
-                            "waiting": {
-                                "reason": "ContainerCreating",
-                                "message": "Container is being created"
-                            }
-                        }
-                    }
-                ]
-            },
-            "spec": {
-                "containers": [
-                    {
-                        "resources": {
-                            "limits": {
-                                "nvidia.com/gpu": "1"
-                            },
-                            "requests": {
-                                "nvidia.com/gpu": "1"
-                            }
-                        }
-                    }
-                ]
-            }
-        }
-        mock_run_command.return_value = (json.dumps(pod_data), "", 0)
+        self.mock_run_command.return_value = (DAEMONSET_JSON_READY, "", 0)
 
         # Run the method
-        result = self.validator.validate_gpu_workload("test-namespace", "test-pod")
+        result = self.validator.validate_driver_daemonset()
 
         # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_workload"]["status"], "failed")
+        self.mock_run_command.assert_called_once_with(OC_GET_DAEMONSETS)
+        self.assertTrue(result)
+        self._assert_status("driver_daemonset", "passed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_workload_no_gpu_request(self, mock_run_command):
-        """Test validate_gpu_workload with no GPU request."""
-        # Setup mock command output
-        pod_data = {
-            "status": {
-                "phase": "Running",
-                "containerStatuses": [
-                    {"ready": True}
-                ]
-            },
-            "spec": {
-                "containers": [
-                    {
-                        "resources": {
-                            "limits": {},
-                            "requests": {}
-                        }
-                    }
-                ]
-            }
+    def test_validate_driver_daemonset_failures(self):
+        """Test validate_driver_daemonset when the driver is not ready or not found."""
+        cases = {
+            "not_ready": DAEMONSET_JSON_NOT_READY,
+            "not_found": DAEMONSET_JSON_OTHER,
         }
-        mock_run_command.return_value = (json.dumps(pod_data), "", 0)
+        for case, ds_json in cases.items():
+            with self.subTest(case):
+                # Setup mock command output; a fresh validator has no cached list
+                self.validator = GPUValidator()
+                self.mock_run_command.return_value = (ds_json, "", 0)
 
-        # Run the method
-        result = self.validator.validate_gpu_workload("test-namespace", "test-pod")
+                # Run the method
+                result = self.validator.validate_driver_daemonset()
 
-        # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_workload"]["status"], "failed")
+                # Assertions
+                self.assertFalse(result)
+                self._assert_status("driver_daemonset", "failed")
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_gpu_workload_errors_in_logs(self, mock_run_command):
-        """Test validate_gpu_workload with errors in logs."""
-        # Setup mock command output for pod info
-        pod_data = {
-            "status": {
-                "phase": "Running",
-                "containerStatuses": [
-                    {"ready": True}
-                ]
-            },
-            "spec": {
-                "containers": [
-                    {
-                        "resources": {
-                            "limits": {
-                                "nvidia.com/gpu": "1"
-                            },
-                            "requests": {
-                                "nvidia.com/gpu": "1"
-                            }
-                        }
-                    }
-                ]
-            }
-        }
-        # Setup mock command output for pod logs with errors
-        pod_logs = "Failed to initialize NVML: Driver/library version mismatch"
+    def test_validate_gpu_workload_success(self):
+        """Test validate_gpu_workload with successful workload."""
+        # Setup mock command output for pod logs
+        pod_logs = "NVIDIA-SMI 470.57.02    Driver Version: 470.57.02    CUDA Version: 11.4"
         
         # Use side_effect to return different values for different calls
-        mock_run_command.side_effect = [
-            (json.dumps(pod_data), "", 0),  # First call: get pod info
-            (pod_logs, "", 0)               # Second call: get pod logs
+        self.mock_run_command.side_effect = [
+            (WORKLOAD_POD_JSON_RUNNING, "", 0),  # First call: get pod info
+            (pod_logs, "", 0)                    # Second call: get pod logs
         ]
 
         # Run the method
         result = self.validator.validate_gpu_workload("test-namespace", "test-pod")
 
         # Assertions
-        self.assertFalse(result)
-        self.assertEqual(self.validator.validation_results["gpu_workload"]["status"], "failed")
-        self.assertIn("Failed to initialize NVML", self.validator.validation_results["gpu_workload"]["details"]["errors"][0])
+        self.assertTrue(result)
+        self._assert_status("gpu_workload", "passed")
+        # Only the tail of the log is fetched
+        self.mock_run_command.assert_called_with([
+            "oc", "logs", "test-pod", "-n", "test-namespace", "--tail=2000"
+        ])
+
+    def test_validate_gpu_workload_failures(self):
+        """Test validate_gpu_workload with a workload that is not using its GPU correctly."""
+        # Each case: the outputs of the pod info and pod logs calls, and the
+        # error expected in the details (if any)
+        cases = {
+            "not_running": ([(WORKLOAD_POD_JSON_PENDING, "", 0)], None),
+            "no_gpu_request": ([(WORKLOAD_POD_JSON_NO_GPU_REQUEST, "", 0)], None),
+            "errors_in_logs": ([(WORKLOAD_POD_JSON_RUNNING, "", 0),
+                                ("Failed to initialize NVML: Driver/library version mismatch", "", 0)],
+                               "Failed to initialize NVML"),
+        }
+        for case, (outputs, error) in cases.items():
+            with self.subTest(case):
+                # Setup mock command outputs
+                self.validator = GPUValidator()
+                self.mock_run_command.side_effect = outputs
+
+                # Run the method
+                result = self.validator.validate_gpu_workload("test-namespace", "test-pod")
+
+                # Assertions
+                self.assertFalse(result)
+                self._assert_status("gpu_workload", "failed")
+                if error is not None:
+                    self.assertIn(error, self.validator.validation_results["gpu_workload"]["details"]["errors"][0])
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_nvidia_smi_on_node_success(self, mock_run_command):
+    def test_validate_nvidia_smi_on_node_success(self):
         """Test validate_nvidia_smi_on_node with successful execution."""
         # Setup mock command outputs
         create_pod_output = ("pod/nvidia-smi-debug-node1 created", "", 0)
-        pod_status_output = (json.dumps({"status": {"phase": "Running"}}), "", 0)
+        pod_ready_output = ("pod/nvidia-smi-debug-node1 condition met", "", 0)
         nvidia_smi_output = (
             "Tue Mar 18 12:34:56 2025       \n"
             "+-----------------------------------------------------------------------------+\n"
@@ -643,39 +768,49 @@ class TestGPUValidator(unittest.TestCase):
             "|===============================+======================+======================|\n"
             "|   0  Tesla V100-SXM2...  On   | 00000000:00:1E.0 Off |                    0 |\n"
             "| N/A   35C    P0    40W / 300W |   1234MiB / 32510MiB |      0%      Default |\n"
-            "+-------------------------------+----------------------+----------------------+\n",
+            "+-------------------------------+----------------------+----------------------+\n"
+            "                                                                               \n"
+            "+-----------------------------------------------------------------------------+\n"
+            "| Processes:                                                                  |\n"
+            "|  GPU   GI   CI        PID   Type   Process name                  GPU Memory |\n"
+            "|=============================================================================|\n"
+            "|    0   N/A  N/A      1234      C   python                          1230MiB |\n"
+            "+-----------------------------------------------------------------------------+\n",
             "",
             0
         )
         delete_pod_output = ("pod/nvidia-smi-debug-node1 deleted", "", 0)
         
         # Set up side_effect to return different outputs for different calls
-        mock_run_command.side_effect = [
+        self.mock_run_command.side_effect = [
             create_pod_output,
-            pod_status_output,
+            pod_ready_output,
             nvidia_smi_output,
             delete_pod_output
         ]
 
-        # Patch open to mock file operations
-        with patch('builtins.open', mock_open()):
-            # Patch json.dump to do nothing
-            with patch('json.dump') as mock_json_dump:
-                # Run the method
-                result = self.validator.validate_nvidia_smi_on_node("node1.example.com")
+        # Run the method
+        result = self.validator.validate_nvidia_smi_on_node("node1.example.com")
 
-                # Assertions
-                self.assertTrue(result)
-                self.assertEqual(self.validator.validation_results["nvidia_smi_node1.example.com"]["status"], "passed")
-                self.assertEqual(self.validator.validation_results["nvidia_smi_node1.example.com"]["details"]["driver_version"], "470.57.02")
-                self.assertIn("Tesla V100", self.validator.validation_results["nvidia_smi_node1.example.com"]["details"]["gpu_info"][0])
+        # Assertions
+        self.assertTrue(result)
+        self._assert_status("nvidia_smi_node1.example.com", "passed")
+        self.assertEqual(self.validator.validation_results["nvidia_smi_node1.example.com"]["details"]["driver_version"], "470.57.02")
+        self.assertEqual(self.validator.validation_results["nvidia_smi_node1.example.com"]["details"]["gpu_info"], [
+            "|   0  Tesla V100-SXM2...  On   | 00000000:00:1E.0 Off |                    0 |",
+            "| N/A   35C    P0    40W / 300W |   1234MiB / 32510MiB |      0%      Default |"
+        ])
 
-    @patch.object(GPUValidator, 'run_command')
-    def test_validate_nvidia_smi_on_node_failure(self, mock_run_command):
+        # The pod manifest is passed on stdin rather than through a temp file
+        create_call = self.mock_run_command.call_args_list[0]
+        self.assertEqual(create_call.args[0], ["oc", "create", "-f", "-"])
+        self.assertEqual(json.loads(create_call.kwargs["input"])["spec"]["nodeSelector"]["kubernetes.io/hostname"], "node1.example.com")
+
+    def test_validate_nvidia_smi_on_node_failure(self):
         """Test validate_nvidia_smi_on_node with nvidia-smi failure."""
         # Setup mock command outputs
         create_pod_output = ("pod/nvidia-smi-debug-node1 created", "", 0)
-        pod_status_output = (json.dumps({"status": {"phase": "Running"}}), "", 0)
+        pod_ready_output = ("pod/nvidia-smi-debug-node1 condition met", "", 0)
         nvidia_smi_output = (
             "NVIDIA-SMI has failed because it couldn't communicate with the NVIDIA driver.",
             "Make sure that the latest NVIDIA driver is installed and running.",
@@ -684,56 +819,104 @@ class TestGPUValidator(unittest.TestCase):
         delete_pod_output = ("pod/nvidia-smi-debug-node1 deleted", "", 0)
         
         # Set up side_effect to return different outputs for different calls
-        mock_run_command.side_effect = [
+        self.mock_run_command.side_effect = [
             create_pod_output,
-            pod_status_output,
+            pod_ready_output,
             nvidia_smi_output,
             delete_pod_output
         ]
 
-        # Patch open to mock file operations
-        with patch('builtins.open', mock_open()):
-            # Patch json.dump to do nothing
-            with patch('json.dump') as mock_json_dump:
-                # Run the method
-                result = self.validator.validate_nvidia_smi_on_node("node1.example.com")
+        # Run the method
+        result = self.validator.validate_nvidia_smi_on_node("node1.example.com")
 
-                # Assertions
-                self.assertFalse(result)
-                self.assertEqual(self.validator.validation_results["nvidia_smi_node1.example.com"]["status"], "failed")
-
-    @patch.object(GPUValidator, 'validate_oc_connection')
-    @patch.object(GPUValidator, 'validate_gpu_operator_installation')
-    @patch.object(GPUValidator, 'validate_gpu_operator_pods')
-    @patch.object(GPUValidator, 'validate_node_gpu_status')
-    @patch.object(GPUValidator, 'validate_gpu_feature_discovery')
-    @patch.object(GPUValidator, 'validate_driver_daemonset')
-    def test_run_all_validations(self, mock_driver, mock_feature, mock_node, mock_pods, mock_operator, mock_connection):
+        # Assertions
+        self.assertFalse(result)
+        self._assert_status("nvidia_smi_node1.example.com", "failed")
+        wait_command = self.mock_run_command.call_args_list[1].args[0]
+        self.assertEqual(wait_command[:3] + wait_command[4:], [
+            "oc", "wait", "--for=condition=Ready", "--timeout=60s"
+        ])
+        self.assertRegex(wait_command[3], r"^pod/nvidia-smi-debug-node1-[0-9a-f]{5}$")
+        # The pod waited for is the one nvidia-smi runs in and the one deleted
+        pod_name = wait_command[3].split("/", 1)[1]
+        self.assertEqual(self.mock_run_command.call_args_list[2].args[0][2], pod_name)
+        self.assertEqual(self.mock_run_command.call_args_list[3].args[0][3], pod_name)
+
+    def test_validate_nvidia_smi_on_node_unique_pod_names(self):
+        """Test that repeated checks of a node use differently named debug pods."""
+        # Setup mock command output
+        self.mock_run_command.return_value = ("pod/nvidia-smi-debug-node1 created", "", 0)
+
+        # Run the method twice
+        self.validator.validate_nvidia_smi_on_node("node1.example.com")
+        self.validator.validate_nvidia_smi_on_node("node1.example.com")
+
+        # Assertions: the second run never collides with a still-terminating first pod
+        create_calls = [call for call in self.mock_run_command.call_args_list
+                        if call.args[0] == ["oc", "create", "-f", "-"]]
+        names = {json.loads(call.kwargs["input"])["metadata"]["name"] for call in create_calls}
+        self.assertEqual(len(names), 2)
+
+    def test_run_all_validations(self):
         """Test run_all_validations method."""
-        # Setup mocks
-        mock_connection.return_value = True
-        mock_operator.return_value = True
-        mock_pods.return_value = True
-        mock_node.return_value = True
-        mock_feature.return_value = True
-        mock_driver.return_value = True
+        # No nodes with GPUs
+        self.mock_run_command.return_value = (EMPTY_LIST_JSON, "", 0)
         
-        # Mock the run_command for get nodes
-        with patch.object(self.validator, 'run_command') as mock_run_command:
-            # No nodes with GPUs
-            mock_run_command.return_value = (json.dumps({"items": []}), "", 0)
+        # Setup mocks for every check, in one patch
+        with patch.multiple(GPUValidator, **dict.fromkeys(CLUSTER_CHECKS, DEFAULT)) as mocks:
+            for mock_check in mocks.values():
+                mock_check.return_value = True
             
             # Run the method
             results = self.validator.run_all_validations()
-            
-            # Assertions
-            mock_connection.assert_called_once()
-            mock_operator.assert_called_once()
-            mock_pods.assert_called_once()
-            mock_node.assert_called_once()
-            mock_feature.assert_called_once()
-            mock_driver.assert_called_once()
-            self.assertIsInstance(results, dict)
+        
+        # Assertions
+        for mock_check in mocks.values():
+            mock_check.assert_called_once()
+        self.assertIsInstance(results, dict)
+
+    def test_run_all_validations_reports_in_check_order(self):
+        """Test that results keep the check order when the checks finish out of order."""
+        keys = ["gpu_operator", "gpu_operator_pods", "node_gpu_status",
+                "gpu_feature_discovery", "driver_daemonset"]
+        finished = [threading.Event() for _ in keys]
+
+        def check(index):
+            def run():
+                # Each check waits for the next one, so they finish in reverse order
+                if index + 1 < len(keys):
+                    self.assertTrue(finished[index + 1].wait(5))
+                self.validator._record(keys[index], {"status": "passed"})
+                finished[index].set()
+                return True
+            return MagicMock(side_effect=run)
+
+        # Setup mock command output
+        self.mock_run_command.return_value = (EMPTY_LIST_JSON, "", 0)
+
+        # Run the method
+        with patch.multiple(GPUValidator, **{name: check(index) for index, name in enumerate(CLUSTER_CHECKS[1:])}):
+            results = self.validator.run_all_validations()
+
+        # Assertions
+        self.assertEqual(list(results), ["oc_connection"] + keys)
+
+    def test_run_all_validations_checks_each_gpu_node(self):
+        """Test that run_all_validations runs nvidia-smi on every GPU node."""
+        # Setup mock command output
+        self.mock_run_command.return_value = (NODE_LIST_JSON_MIXED, "", 0)
+
+        # Run the method
+        checks = dict.fromkeys(CLUSTER_CHECKS + ("validate_nvidia_smi_on_node",), DEFAULT)
+        with patch.multiple(GPUValidator, **checks) as mocks:
+            self.validator.run_all_validations()
+
+        # Assertions
+        mock_smi = mocks["validate_nvidia_smi_on_node"]
+        self.assertEqual(sorted(call.args[0] for call in mock_smi.call_args_list), ["gpu1", "gpu2"])
+        node_list_calls = [call for call in self.mock_run_command.call_args_list
+                           if call.args[0] == OC_GET_NODES]
+        self.assertEqual(len(node_list_calls), 1)
 
     @patch.object(GPUValidator, 'run_all_validations')
     def test_print_validation_results(self, mock_run_all_validations):
@@ -754,15 +937,11 @@ class TestGPUValidator(unittest.TestCase):
             }
         }
         
-        # Redirect stdout to capture printed output
+        # Call the method, capturing what it prints; stdout is restored even
+        # if it raises
         captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
-        # Call the method
-        self.validator.print_validation_results()
-        
-        # Reset stdout
-        sys.stdout = sys.__stdout__
+        with contextlib.redirect_stdout(captured_output):
+            self.validator.print_validation_results()
         
         # Assertions
         output = captured_output.getvalue()
@@ -773,6 +952,215 @@ class TestGPUValidator(unittest.TestCase):
         self.assertIn("test_fail", output)
         self.assertIn("test_warning", output)
 
+    @patch('gpu_validator.node_cache.is_known', return_value=True)
+    @patch('subprocess.run')
+    def test_create_gpu_test_pod(self, mock_run, mock_is_known):
+        """Test create_gpu_test_pod pipes the manifest to oc."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "pod/gpu-test serverside-applied", "")
+
+        # Call the function
+        pod_name = create_gpu_test_pod("test-namespace", "node1.example.com")
+
+        # Assertions
+        self.assertTrue(pod_name.startswith("gpu-test-"))
+        self.assertEqual(mock_run.call_args.args[0], [
+            "oc", "apply", "--server-side", "--field-manager=gpu-validator", "--force-conflicts",
+            "--request-timeout=10s", "-f", "-"
+        ])
+        pod_json = json.loads(mock_run.call_args.kwargs["input"])
+        self.assertEqual(pod_json["metadata"], {
+            "name": pod_name, "namespace": "test-namespace", "labels": {"app": "gpu-validator"}
+        })
+        self.assertEqual(pod_json["spec"]["nodeSelector"], {"kubernetes.io/hostname": "node1.example.com"})
+        self.assertEqual(pod_json["spec"]["activeDeadlineSeconds"], 300)
+
+    @patch('subprocess.run')
+    def test_create_gpu_test_pod_failure(self, mock_run):
+        """Test create_gpu_test_pod when oc fails."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 1, "", "error: forbidden")
+
+        # Call the function
+        self.assertEqual(create_gpu_test_pod("test-namespace"), "")
+
+    @patch('time.sleep')
+    @patch('subprocess.run')
+    def test_create_gpu_test_pod_retries_when_throttled(self, mock_run, mock_sleep):
+        """Test create_gpu_test_pod retries while the API server throttles it."""
+        # Setup mock command output
+        throttled = subprocess.CompletedProcess([], 1, "", "Error from server (TooManyRequests): slow down")
+        created = subprocess.CompletedProcess([], 0, "pod serverside-applied", "")
+        mock_run.side_effect = [throttled, throttled, created]
+
+        # Call the function
+        pod_name = create_gpu_test_pod("test-namespace")
+
+        # Assertions
+        self.assertNotEqual(pod_name, "")
+        self.assertEqual(mock_run.call_count, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0])
+
+    @patch('subprocess.run')
+    def test_create_gpu_test_pod_unknown_node(self, mock_run):
+        """Test create_gpu_test_pod rejects a node that does not exist."""
+        # Setup mock command output: the node list
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "node/node1\nnode/node2\n", "")
+
+        # Call the function
+        with patch('gpu_validator.node_cache', NodeCache()):
+            self.assertEqual(create_gpu_test_pod("test-namespace", "node3"), "")
+
+        # Assertions: only the node list was requested
+        self.assertEqual(mock_run.call_args.args[0][:4], ["oc", "get", "nodes", "-o"])
+
+    @patch('subprocess.run')
+    def test_node_cache_lists_nodes_once(self, mock_run):
+        """Test NodeCache reuses the node list within its TTL."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "node/node1\nnode/node2\n", "")
+
+        # Call the methods
+        cache = NodeCache()
+        self.assertTrue(cache.is_known("node1"))
+        self.assertFalse(cache.is_known("node3"))
+
+        # Assertions
+        mock_run.assert_called_once()
+        self.assertEqual(cache.names(), frozenset({"node1", "node2"}))
+
+    @patch('subprocess.run')
+    def test_create_gpu_test_job(self, mock_run):
+        """Test create_gpu_test_job covers every node with one job."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "job.batch/gpu-test serverside-applied", "")
+
+        # Call the function
+        job_name = create_gpu_test_job("test-namespace", ["node1", "node2"])
+
+        # Assertions
+        mock_run.assert_called_once()
+        job_json = json.loads(mock_run.call_args.kwargs["input"])
+        self.assertEqual(job_json["metadata"]["name"], job_name)
+        self.assertEqual(job_json["spec"]["completions"], 2)
+        self.assertEqual(job_json["spec"]["parallelism"], 2)
+        self.assertEqual(job_json["spec"]["ttlSecondsAfterFinished"], 30)
+        node_affinity = job_json["spec"]["template"]["spec"]["affinity"]["nodeAffinity"]
+        expression = node_affinity["requiredDuringSchedulingIgnoredDuringExecution"]["nodeSelectorTerms"][0]["matchExpressions"][0]
+        self.assertEqual(expression["values"], ["node1", "node2"])
+
+    @patch('subprocess.run')
+    def test_wait_for_gpu_test_pod(self, mock_run):
+        """Test wait_for_gpu_test_pod waits on the pod's Ready condition."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "pod/gpu-test-1 condition met", "")
+
+        # Call the function
+        self.assertTrue(wait_for_gpu_test_pod("test-namespace", "gpu-test-1", timeout=30))
+
+        # Assertions
+        self.assertEqual(mock_run.call_args.args[0], [
+            "oc", "wait", "--for=condition=Ready", "pod/gpu-test-1", "-n", "test-namespace", "--timeout=30s"
+        ])
+
+    @patch('subprocess.run')
+    def test_wait_for_gpu_test_pods(self, mock_run):
+        """Test wait_for_gpu_test_pods waits on all pods with one oc call."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess(
+            [], 1, "pod/gpu-test-1 condition met\n", "error: timed out waiting for the condition on pods/gpu-test-2"
+        )
+
+        # Call the function
+        result = wait_for_gpu_test_pods("test-namespace", ["gpu-test-1", "gpu-test-2"])
+
+        # Assertions
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args.args[0][-2:], ["pod/gpu-test-1", "pod/gpu-test-2"])
+        self.assertEqual(result, {"gpu-test-1": True, "gpu-test-2": False})
+
+    @patch('gpu_validator.node_cache.is_known', return_value=True)
+    @patch('subprocess.run')
+    def test_create_gpu_test_pods(self, mock_run, mock_is_known):
+        """Test create_gpu_test_pods creates all pods with one oc call."""
+        # Setup mock command output: every pod but the one for node2 is created
+        def oc_create(command, input, **kwargs):
+            pods = json.loads(input)["items"]
+            created = [f"pod/{pod['metadata']['name']}"
+                       for pod in pods if pod["spec"]["nodeSelector"]["kubernetes.io/hostname"] != "node2"]
+            return subprocess.CompletedProcess(command, 1, "".join(f"{name} serverside-applied\n" for name in created),
+                                               "Error from server (Forbidden): exceeded quota")
+        mock_run.side_effect = oc_create
+
+        # Call the function
+        pod_names = create_gpu_test_pods("test-namespace", ["node1", "node2", "node3"])
+
+        # Assertions
+        mock_run.assert_called_once()
+        pods = json.loads(mock_run.call_args.kwargs["input"])["items"]
+        self.assertEqual([pod["spec"]["nodeSelector"]["kubernetes.io/hostname"] for pod in pods],
+                         ["node1", "node2", "node3"])
+        self.assertEqual(pod_names, [pods[0]["metadata"]["name"], "", pods[2]["metadata"]["name"]])
+
+    @patch('subprocess.run')
+    def test_exec_gpu_test_uses_agent_pod(self, mock_run):
+        """Test exec_gpu_test runs nvidia-smi in the node's agent pod."""
+        # Setup mock command output
+        mock_run.side_effect = [
+            subprocess.CompletedProcess([], 0, "pod/gpu-validator-agent-abcde\n", ""),
+            subprocess.CompletedProcess([], 0, "GPU 0: Tesla V100-SXM2-32GB", "")
+        ]
+
+        # Call the function
+        self.assertTrue(exec_gpu_test("test-namespace", "node1", use_agent=True))
+
+        # Assertions
+        self.assertEqual(mock_run.call_args.args[0], [
+            "oc", "exec", "-n", "test-namespace", "pod/gpu-validator-agent-abcde", "--", "nvidia-smi", "-L"
+        ])
+
+    @patch('gpu_validator.wait_for_gpu_test_pod', return_value=True)
+    @patch('gpu_validator.create_gpu_test_pod', return_value="gpu-test-1")
+    @patch('subprocess.run')
+    def test_exec_gpu_test_without_agent(self, mock_run, mock_create, mock_wait):
+        """Test exec_gpu_test falls back to a GPU test pod."""
+        # Setup mock command output: no agent pod on the node
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+
+        # Call the function
+        self.assertTrue(exec_gpu_test("test-namespace", "node1", use_agent=True))
+
+        # Assertions
+        mock_create.assert_called_once_with("test-namespace", "node1")
+        mock_wait.assert_called_once_with("test-namespace", "gpu-test-1")
+        self.assertEqual(mock_run.call_args.args[0][:4], ["oc", "delete", "pod", "gpu-test-1"])
+
+    @patch('gpu_validator.wait_for_gpu_test_pod', return_value=True)
+    @patch('gpu_validator.create_gpu_test_pod', return_value="gpu-test-1")
+    @patch('subprocess.run')
+    def test_exec_gpu_test_default_requests_gpu(self, mock_run, mock_create, mock_wait):
+        """Test exec_gpu_test uses a GPU-requesting test pod unless the agent is asked for."""
+        # Setup mock command output
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+
+        # Call the function
+        self.assertTrue(exec_gpu_test("test-namespace", "node1"))
+
+        # Assertions: the agent pod is not even looked up
+        mock_create.assert_called_once_with("test-namespace", "node1")
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args.args[0][:4], ["oc", "delete", "pod", "gpu-test-1"])
+
+    @patch('gpu_validator.exec_gpu_test', side_effect=lambda namespace, node_name, use_agent: node_name != "node2")
+    def test_exec_gpu_tests(self, mock_exec):
+        """Test exec_gpu_tests checks every node."""
+        # Call the function
+        result = exec_gpu_tests("test-namespace", ["node1", "node2", "node3"])
+
+        # Assertions
+        self.assertEqual(mock_exec.call_count, 3)
+        self.assertEqual(result, {"node1": True, "node2": False, "node3": True})
+
     @patch('gpu_validator.GPUValidator')
     def test_validate_gpu_setup(self, mock_validator_class):
         """Test validate_gpu_setup function."""
@@ -790,4 +1178,22 @@ class TestGPUValidator(unittest.TestCase):
         mock_validator.print_validation_results.assert_called_once()
         self.assertEqual(result, {"test": "result"})
 
-    @patch('gpu_validator.GPU
\ No newline at end of file
+    @patch('gpu_validator.GPUValidator')
+    def test_test_gpu_workload(self, mock_validator_class):
+        """Test test_gpu_workload function."""
+        # Setup mock validator
+        mock_validator = MagicMock()
+        mock_validator.validate_gpu_workload.return_value = True
+        mock_validator_class.return_value = mock_validator
+        
+        # Call the function
+        result = gpu_validator.test_gpu_workload("test-namespace", "test-pod")
+        
+        # Assertions
+        mock_validator.validate_oc_connection.assert_called_once()
+        mock_validator.validate_gpu_workload.assert_called_once_with("test-namespace", "test-pod")
+        mock_validator.print_validation_results.assert_called_once()
+        self.assertTrue(result)
+
+if __name__ == "__main__":
+    unittest.main()
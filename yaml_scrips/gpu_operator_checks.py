@@ -1,214 +1,208 @@
+import io
+import json
+import os
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from oc_cache import CHECK_KINDS, cached_oc_output, fetch_many
+
+# How long the oc client version is reused from the on-disk cache
+OC_VERSION_TTL = 3600  # seconds
 
 def check_oc_installation():
     """Check if the OpenShift CLI (oc) is installed on the system."""
-    try:
-        version_result = subprocess.run(
-            "oc version",
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        if version_result.returncode == 0:
-            print("OpenShift CLI (oc) is installed:")
-            print(version_result.stdout)
-            return True
-        else:
-            print("OpenShift CLI (oc) installation check failed:")
-            print(version_result.stderr)
-            return False
-    except FileNotFoundError:
+    if shutil.which("oc") is None:
         print("Error: 'oc' command not found")
         print("Please ensure the OpenShift CLI ('oc') is installed and added to your PATH")
         return False
+    
+    # Only the client version is needed, so the API server is not contacted,
+    # and repeated runs reuse the answer for a while
+    try:
+        version = cached_oc_output("oc-version", ["oc", "version", "--client=true"], ttl=OC_VERSION_TTL)
+    except subprocess.CalledProcessError as e:
+        print("OpenShift CLI (oc) installation check failed:")
+        print(e.stderr.decode("utf-8"))
+        return False
+    print("OpenShift CLI (oc) is installed:")
+    print(version.decode("utf-8"))
+    return True
+
+def fetch_cluster_state():
+    """
+    Fetch the nodes, NodeFeatureDiscovery and ClusterPolicy objects the checks
+    need with one `oc get` call, and return their items grouped by Kind.
+    Returns None if none of them could be fetched; each check then reports it.
+    """
+    try:
+        return fetch_many(CHECK_KINDS)
+    except subprocess.CalledProcessError as e:
+        print("Failed to query the cluster:")
+        print(e.stderr.decode("utf-8"))
+        return None
+    except FileNotFoundError:
+        print("Failed to query the cluster: 'oc' command not found")
+        return None
+
+def check_nfd_create(state):
+    """Check that NodeFeatureDiscovery is set up; returns True if it is."""
+    # NodeFeatureDiscovery instances in the openshift-nfd namespace
+    names = [item["metadata"]["name"] for item in (state or {}).get("NodeFeatureDiscovery", [])
+             if item["metadata"].get("namespace") == "openshift-nfd"]
+    
+    if names:
+        print("NodeFeatureDiscovery check executed successfully!")
+        print("Output:")
+        print("\n".join(names))
+        return True
+    print("NodeFeatureDiscovery check failed: no NodeFeatureDiscovery found in 'openshift-nfd'")
+    print("\nPossible issues:")
+    print("- Not logged into an OpenShift cluster")
+    print("- No access to the 'openshift-nfd' namespace")
+    print("- NodeFeatureDiscovery resource doesn't exist")
+    return False
+
+ 
+def check_nvidia_gpu_nodes(state):
+    if state is None:
+        print("NVIDIA GPU nodes check failed: the node list could not be retrieved")
+        print("\nPossible issues:")
+        print("- Not logged into an OpenShift cluster")
+        print("- Node Feature Discovery operator might not be installed")
+        print("- No nodes with NVIDIA GPUs exist in the cluster")
+        return
+    
+    # Nodes labelled by Node Feature Discovery as having an NVIDIA PCI device
+    names = [node["metadata"]["name"] for node in state.get("Node", [])
+             if "feature.node.kubernetes.io/pci-10de.present" in node["metadata"].get("labels", {})]
+    
+    print("NVIDIA GPU nodes check executed successfully!")
+    if names:
+        print("Nodes with NVIDIA GPUs found:")
+        print("\n".join(names))
+    else:
+        print("No nodes with NVIDIA GPUs found in the cluster")
 
-def check_nfd_create():
-    # Command to check NodeFeatureDiscovery
-    command = "oc get NodeFeatureDiscovery -n openshift-nfd"
+def check_clusterpolicy_crd(state):
+    """Check if the ClusterPolicy CRD exists in the cluster; returns True if it does."""
+    # Listing ClusterPolicy objects only works when the CRD exists, so the
+    # CRD only needs its own query when no ClusterPolicy was found
+    if (state or {}).get("ClusterPolicy"):
+        print("ClusterPolicy CRD check executed successfully!")
+        print("Output:")
+        print("crd/clusterpolicies.nvidia.com")
+        return True
+    
+    command = ["oc", "get", "crd/clusterpolicies.nvidia.com", "-o", "name"]
     
     try:
-        # Execute the command and capture output
         result = subprocess.run(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
         
-        # Check the return code
         if result.returncode == 0:
-            print("NodeFeatureDiscovery check executed successfully!")
+            print("ClusterPolicy CRD check executed successfully!")
             print("Output:")
             print(result.stdout)
-        else:
-            print("NodeFeatureDiscovery check failed with the following error:")
-            print(result.stderr)
-            print("\nPossible issues:")
-            print("- Not logged into an OpenShift cluster")
-            print("- No access to the 'openshift-nfd' namespace")
-            print("- NodeFeatureDiscovery resource doesn't exist")
+            return True
+        print("ClusterPolicy CRD check failed with the following error:")
+        print(result.stderr)
+        print("\nPossible issues:")
+        print("- Not logged into an OpenShift cluster")
+        print("- NVIDIA GPU Operator might not be installed")
+        print("- ClusterPolicy CRD has not been deployed")
     except Exception as e:
         print(f"An unexpected error occurred: {str(e)}")
+    return False
 
- 
-def check_nvidia_gpu_nodes():
-    # Command to check nodes with NVIDIA GPUs
-    command = "oc get nodes -l feature.node.kubernetes.io/pci-10de.present"
+def check_clusterpolicy_status(state):
+    """Check the status of ClusterPolicy instances and show details if not ready."""
+    if state is None:
+        print("Failed to retrieve ClusterPolicy status")
+        return
     
-    try:
-        # Execute the command and capture output
-        result = subprocess.run(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+    policies = state.get("ClusterPolicy", [])
+    if not policies:
+        print("No ClusterPolicy instances found in the cluster")
+        return
+    
+    for policy in policies:
+        name = policy["metadata"]["name"]
+        policy_state = policy.get("status", {}).get("state", "<none>")
+        print(f"ClusterPolicy {name}: {policy_state}")
         
-        # Check the return code
-        if result.returncode == 0:
-            print("NVIDIA GPU nodes check executed successfully!")
-            if result.stdout.strip():  # Check if there's any output
-                print("Nodes with NVIDIA GPUs found:")
-                print(result.stdout)
+        # If NotReady, the Ready condition's message explains why
+        if policy_state == "notReady":
+            message = next((condition.get("message") for condition in policy.get("status", {}).get("conditions", [])
+                            if condition.get("type") == "Ready" and condition.get("status") == "False"), None)
+            if message:
+                print(f"  Message: {message}")
             else:
-                print("No nodes with NVIDIA GPUs found in the cluster")
-        else:
-            print("NVIDIA GPU nodes check failed with the following error:")
-            print(result.stderr)
-            print("\nPossible issues:")
-            print("- Not logged into an OpenShift cluster")
-            print("- Node Feature Discovery operator might not be installed")
-            print("- No nodes with NVIDIA GPUs exist in the cluster")
-    except Exception as e:
-        print(f"An unexpected error occurred: {str(e)}")
+                print("  No detailed message found for the Ready condition")
 
-def check_clusterpolicy_crd():
-    """Check if the ClusterPolicy CRD exists in the cluster."""
-    command = "oc get crd/clusterpolicies.nvidia.com"
-    
+# How long wait_for_clusterpolicy_ready waits for the policies by default
+CLUSTERPOLICY_READY_TIMEOUT = 300  # seconds
+
+def wait_for_clusterpolicy_ready(timeout=CLUSTERPOLICY_READY_TIMEOUT):
+    """Wait until every ClusterPolicy reports the ready state, or until timeout."""
+    # oc wait watches the objects, so it returns as soon as they are ready
+    # instead of polling the cluster
+    command = ["oc", "wait", "clusterpolicy", "--all", "--for=jsonpath={.status.state}=ready",
+               f"--timeout={timeout}s"]
     try:
         result = subprocess.run(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
-        
         if result.returncode == 0:
-            print("ClusterPolicy CRD check executed successfully!")
-            print("Output:")
+            print("All ClusterPolicy instances are ready:")
             print(result.stdout)
-        else:
-            print("ClusterPolicy CRD check failed with the following error:")
-            print(result.stderr)
-            print("\nPossible issues:")
-            print("- Not logged into an OpenShift cluster")
-            print("- NVIDIA GPU Operator might not be installed")
-            print("- ClusterPolicy CRD has not been deployed")
-    except Exception as e:
-        print(f"An unexpected error occurred: {str(e)}")
-
-def check_clusterpolicy_status():
-    """Check the status of ClusterPolicy instances and fetch details if not ready."""
-    # Step 1: Get the list of ClusterPolicies and their states
-    get_command = "oc get clusterpolicy -o custom-columns=NAME:.metadata.name,STATE:.status.state --no-headers"
-    try:
-        get_result = subprocess.run(
-            get_command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Check if the oc get command executed successfully
-        if get_result.returncode == 0:
-            output_lines = get_result.stdout.strip().splitlines()
-            if output_lines:
-                for line in output_lines:
-                    # Parse name and state from each line
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        name, state = parts[0], parts[1]
-                        print(f"ClusterPolicy {name}: {state}")
-                        
-                        # Step 2: If NotReady, run oc describe to get the message
-                        if state == "notReady":
-                            describe_command = f"oc describe clusterpolicy {name}"
-                            try:
-                                describe_result = subprocess.run(
-                                    describe_command,
-                                    shell=True,
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE,
-                                    text=True
-                                )
-                                if describe_result.returncode == 0:
-                                    message = parse_ready_condition_message(describe_result.stdout)
-                                    if message:
-                                        print(f"  Message: {message}")
-                                    else:
-                                        print("  No detailed message found for the Ready condition")
-                                else:
-                                    print("  Failed to run oc describe:")
-                                    print(f"  {describe_result.stderr}")
-                            except Exception as e:
-                                print(f"  An error occurred while running oc describe: {str(e)}")
-                    else:
-                        print(f"Unexpected output format: {line}")
-            else:
-                print("No ClusterPolicy instances found in the cluster")
-        else:
-            print("Failed to retrieve ClusterPolicy status:")
-            print(get_result.stderr)
+            return True
+        print(f"ClusterPolicy instances did not become ready within {timeout}s:")
+        print(result.stdout)
+        print(result.stderr)
+        return False
     except Exception as e:
         print(f"An unexpected error occurred: {str(e)}")
+        return False
 
-def parse_ready_condition_message(describe_output):
-    """Parse the oc describe output to find the Message for the Ready condition with Status: False."""
-    lines = describe_output.splitlines()
-    in_conditions = False
-    current_type = None
-    current_status = None
-    for line in lines:
-        line = line.strip()
-        if line.startswith("Conditions:"):
-            in_conditions = True
-        elif in_conditions:
-            if line.startswith("Type:"):
-                current_type = line.split(":", 1)[1].strip()
-            elif line.startswith("Status:"):
-                current_status = line.split(":", 1)[1].strip()
-            elif line.startswith("Message:") and current_type == "Ready" and current_status == "False":
-                return line.split(":", 1)[1].strip()
-    return None
+# Lines of log shown per GPU operator pod
+OPERATOR_LOG_TAIL_LINES = 200
 
 def check_gpu_operator_logs():
     """Fetch and display logs for GPU operator pods in the nvidia-gpu-operator namespace."""
-    command = "oc logs -n nvidia-gpu-operator -lapp=gpu-operator"
+    # Only the recent end of each pod's log, labelled with the pod it came from
+    command = ["oc", "logs", "-n", "nvidia-gpu-operator", "-lapp=gpu-operator",
+               f"--tail={OPERATOR_LOG_TAIL_LINES}", "--prefix=true"]
     try:
+        # The logs are only passed through, so keep them as bytes
         result = subprocess.run(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stderr=subprocess.PIPE
         )
         if result.returncode == 0:
             print("GPU operator logs retrieved successfully!")
             if result.stdout.strip():
                 print("Logs:")
-                print(result.stdout)
+                sys.stdout.flush()
+                sys.stdout.buffer.write(result.stdout)
+                if not result.stdout.endswith(b"\n"):
+                    sys.stdout.buffer.write(b"\n")
+                sys.stdout.buffer.flush()
             else:
                 print("No logs found for GPU operator pods.")
         else:
             print("Failed to retrieve GPU operator logs:")
-            print(result.stderr)
+            print(result.stderr.decode("utf-8", "replace"))
             print("\nPossible issues:")
             print("- Not logged into an OpenShift cluster")
             print("- The 'nvidia-gpu-operator' namespace does not exist")
@@ -219,37 +213,44 @@ def check_gpu_operator_logs():
 
 def check_gpu_operator_pods():
     """Check if the GPU operator pods are running in the nvidia-gpu-operator namespace."""
-    command = "oc get pods -n nvidia-gpu-operator -lapp=gpu-operator"
+    command = ["oc", "get", "pods", "-n", "nvidia-gpu-operator", "-lapp=gpu-operator", "-o", "json"]
     try:
         result = subprocess.run(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True
         )
         if result.returncode == 0:
-            lines = result.stdout.splitlines()
-            if len(lines) > 1:  # Check if there are pods listed beyond the header
+            pods = json.loads(result.stdout).get("items", [])
+            if pods:
                 running_pods = 0
-                for line in lines[1:]: # Skip the first line as it is assumed to be a header
-                    parts = line.split()
-                    if len(parts) >= 3 and parts[2] == 'Running':
+                error_messages = []
+                details = []
+                for pod in pods:
+                    status = pod.get("status", {})
+                    # A container stuck waiting says more than the pod phase
+                    reasons = [container["state"]["waiting"].get("reason", "")
+                               for container in status.get("containerStatuses", [])
+                               if "waiting" in container.get("state", {})]
+                    if status.get("phase") == "Running" and not reasons:
                         running_pods += 1
-                    elif status == 'ImagePullBackOff':
+                    if "ImagePullBackOff" in reasons:
                         error_messages.append("Pod in 'ImagePullBackOff' status: maybe the NVIDIA registry is down.")
-                    elif status == 'CrashLoopBackOff':
-                        error_messages.append("Pod in 'CrashLoopBackOff' status: review the operator logs.") 
-                        check_gpu_operator_logs()
+                    elif "CrashLoopBackOff" in reasons:
+                        error_messages.append("Pod in 'CrashLoopBackOff' status: review the operator logs.")
+                    details.append(f"{pod['metadata']['name']}  {', '.join(reasons) or status.get('phase', 'Unknown')}")
 
                 if running_pods > 0:
                     print(f"GPU operator is running with {running_pods} pod(s) in 'Running' state.")
-                    print("Pod details:")
-                    print(result.stdout)
                 else:
                     print("GPU operator pods are present but none are in 'Running' state.")
-                    print("Pod details:")
-                    print(result.stdout)
+                print("Pod details:")
+                print("\n".join(details))
+                for message in error_messages:
+                    print(message)
+                if any("CrashLoopBackOff" in message for message in error_messages):
+                    check_gpu_operator_logs()
             else:
                 print("No GPU operator pods found in the nvidia-gpu-operator namespace.")
         else:
@@ -262,17 +263,87 @@ def check_gpu_operator_pods():
     except Exception as e:
         print(f"An unexpected error occurred: {str(e)}")
 
+def check_cluster_state():
+    """Run the checks that read the shared cluster state, starting with NodeFeatureDiscovery."""
+    # Nodes, NodeFeatureDiscovery and ClusterPolicy come from one oc call
+    state = fetch_cluster_state()
+    # GPU nodes are found through NFD labels, and the GPU operator's
+    # ClusterPolicy is only worth checking once NFD is set up
+    if not check_nfd_create(state):
+        print("\nSkipping the GPU node and ClusterPolicy checks: NodeFeatureDiscovery is not set up")
+        return
+    print("\nChecking for nodes with NVIDIA GPUs...")
+    check_nvidia_gpu_nodes(state)
+    print("\nChecking ClusterPolicy CRD...")
+    if not check_clusterpolicy_crd(state):
+        print("\nSkipping the ClusterPolicy status check: the CRD is missing")
+        return
+    if os.environ.get("WAIT") == "1":
+        # Used as a readiness gate: wait for the policies instead of one look
+        print("\nWaiting for ClusterPolicy to become ready...")
+        wait_for_clusterpolicy_ready()
+    else:
+        print("\nChecking ClusterPolicy status...")
+        check_clusterpolicy_status(state)
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout that sends what a worker thread prints to that
+    thread's own buffer, and everything else to the real stream. Like the real
+    stream it has a binary .buffer, for output passed through as bytes.
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def _current(self):
+        return getattr(self._local, "stream", self._stream)
+    
+    @property
+    def buffer(self):
+        return self._current().buffer
+    
+    def write(self, text):
+        return self._current().write(text)
+    
+    def flush(self):
+        self._current().flush()
+    
+    def capture(self, title, check):
+        """Print title, run check() and return everything that was printed, as bytes."""
+        # write_through keeps text and direct .buffer writes in order
+        self._local.stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+        try:
+            print(title)
+            check()
+            return self._local.stream.buffer.getvalue()
+        finally:
+            del self._local.stream
+
+def run_checks(checks):
+    """
+    Run the (title, check) pairs side by side, since each check mostly waits
+    on oc, and print their output in the given order so it does not interleave.
+    """
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            results = list(executor.map(lambda pair: output.capture(*pair), checks))
+    finally:
+        sys.stdout = output._stream
+    sys.stdout.flush()
+    for data in results:
+        sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
 # Run the script
 if __name__ == "__main__":
     print("Checking OpenShift CLI installation...")
-    check_oc_installation()
-    print("\nChecking NodeFeatureDiscovery command...")
-    check_nfd_create()
-    print("\nChecking for nodes with NVIDIA GPUs...")
-    check_nvidia_gpu_nodes()
-    print("\nChecking ClusterPolicy CRD...")
-    check_clusterpolicy_crd()
-    print("\nChecking ClusterPolicy status...")
-    check_clusterpolicy_status()
-    print("\nChecking GPU operator pods...")
-    check_gpu_operator_pods()
+    # Every other check needs oc; without it they could only fail
+    if not check_oc_installation():
+        sys.exit(1)
+    run_checks([
+        ("\nChecking NodeFeatureDiscovery command...", check_cluster_state),
+        ("\nChecking GPU operator pods...", check_gpu_operator_pods),
+    ])
@@ -1,38 +1,56 @@
-import platform
 import subprocess
 import os
 
 # Fixed folder location inside the container where the RPM packages are stored.
 FIXED_RPM_FOLDER = "/root/mft/rpms"  # Update this to the actual folder path
 
-def get_kernel_version():
+def get_kernel_version(short=False):
     """
-    Returns the Linux kernel version as a string.
-    It extracts the part before the first '-' from the release string.
-    For example, from '4.18.0-147.el8.x86_64', it returns '4.18.0'.
+    Returns the Linux kernel version as a string, e.g. '4.18.0-147.el8.x86_64'.
+    With short=True it returns only the part before the first '-', e.g. '4.18.0'.
     """
- #   return platform.uname().release.split('-')[0]
-    return platform.uname().release
+    # os.uname() is a single syscall; platform.uname() also gathers processor
+    # details, which can mean running `uname -p`
+    release = os.uname().release
+    return release.split('-')[0] if short else release
       
-def install_rpm(kernel_version):
+# Packages built for the running kernel that are installed from the folder
+KERNEL_PACKAGES = ("kernel-devel",)
+
+def install_rpms(kernel_version, names=KERNEL_PACKAGES):
     """
-    Installs the kernel-devel package using dnf from the fixed RPM folder.
-    Constructs the package filename using the kernel version.
+    Installs the kernel packages in `names` from the fixed RPM folder with a
+    single rpm transaction. Constructs each package filename using the kernel
+    version; packages missing from the folder are reported and skipped.
     """
-    package_file = f"kernel-devel-{kernel_version}.rpm"
-    package_path = os.path.join(FIXED_RPM_FOLDER, package_file)
+    package_files = [f"{name}-{kernel_version}.rpm" for name in names]
+    # One directory listing instead of a lookup per package
+    try:
+        available = set(os.listdir(FIXED_RPM_FOLDER))
+    except OSError as e:
+        print(f"Cannot read the RPM folder {FIXED_RPM_FOLDER}. Error: {e}")
+        return
+    for package_file in package_files:
+        if package_file not in available:
+            print(f"Package {package_file} not found in {FIXED_RPM_FOLDER}, skipping it.")
+    package_files = [package_file for package_file in package_files if package_file in available]
+    if not package_files:
+        return
     
+    package_paths = [os.path.join(FIXED_RPM_FOLDER, package_file) for package_file in package_files]
     try:
-        subprocess.run(["rpm", "-ivh" , "--replacepkgs" , package_path , "--nodeps"], check=True)
-        print(f"Successfully installed {package_file}.")
+        # -i rather than -U: kernel packages are installed side by side, and an
+        # upgrade would remove the ones built for other kernels
+        subprocess.run(["rpm", "-ivh", "--replacepkgs", "--nodeps", *package_paths], check=True)
+        print(f"Successfully installed {', '.join(package_files)}.")
     except subprocess.CalledProcessError as e:
-        print(f"Failed to install {package_file}. Error: {e}")
+        print(f"Failed to install {', '.join(package_files)}. Error: {e}")
 
 def main():
     kernel_version = get_kernel_version()
     print(f"Kernel Version: {kernel_version}")
     print(f"Using RPM package from fixed folder: {FIXED_RPM_FOLDER}")
-    install_rpm(kernel_version)
+    install_rpms(kernel_version)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,120 @@
+"""
+Short-lived on-disk cache for `oc` query results.
+
+The checker scripts are often run back to back; reusing a result that is
+only a few seconds old avoids another fork of `oc` and API round trip.
+"""
+
+import hashlib
+import os
+import pathlib
+import subprocess
+import time
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+CACHE_DIR = pathlib.Path(os.path.expanduser("~/.cache/work_backup"))
+DEFAULT_TTL = 30  # seconds
+
+# Results already fetched by this process, keyed by cache name
+_memory = {}
+
+# Cache file suffix for the cluster oc currently points at; found once per process
+_cluster_suffix = None
+
+def _cluster_file_suffix():
+    """
+    Return a short digest of the KUBECONFIG setting and the current
+    context's API server, so cache files written for one cluster are never
+    served after `oc login` to another. `oc whoami --show-server` reads the
+    kubeconfig only and makes no API call. Returns "" if the server cannot
+    be determined; the disk cache is then not used.
+    """
+    global _cluster_suffix
+    if _cluster_suffix is None:
+        try:
+            result = subprocess.run(["oc", "whoami", "--show-server"], stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+            identity = os.environ.get("KUBECONFIG", "").encode() + b"\0" + result.stdout.strip()
+            _cluster_suffix = hashlib.sha256(identity).hexdigest()[:16]
+        except (OSError, subprocess.CalledProcessError):
+            _cluster_suffix = ""
+    return _cluster_suffix
+
+def cached_oc_output(name, command, ttl=DEFAULT_TTL):
+    """
+    Return the stdout (bytes) of `command`, reusing the result cached under
+    `name` for the current cluster if it is younger than `ttl` seconds.
+    Results are kept in memory as well, so callers in the same process do
+    not re-read the cache file.
+    Raises subprocess.CalledProcessError if the command fails; failures are
+    never cached.
+    """
+    cached = _memory.get(name)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # Cache files are per cluster, as the directory is shared by every process
+    suffix = _cluster_file_suffix()
+    path = CACHE_DIR / f"{name}-{suffix}.out" if suffix else None
+    try:
+        if path is not None and time.time() - path.stat().st_mtime < ttl:
+            data = path.read_bytes()
+            _memory[name] = (time.monotonic(), data)
+            return data
+    except OSError:
+        pass
+
+    # run() drains stdout and stderr concurrently, so a chatty command cannot
+    # fill one pipe and stall; stdin is closed so oc never waits for input.
+    result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, check=True)
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(result.stdout)
+        except OSError:
+            pass  # the cache is best-effort
+    _memory[name] = (time.monotonic(), result.stdout)
+    return result.stdout
+
+# Resource kinds queried by the checker scripts. Using the same list in every
+# script lets them share one cached `oc get` call.
+CHECK_KINDS = ("nodes", "NodeFeatureDiscovery.nfd.openshift.io", "clusterpolicies.nvidia.com")
+
+def fetch_many(kinds, ttl=DEFAULT_TTL):
+    """
+    Fetch several resource kinds with a single `oc get <kinds> -A -o json`
+    call and return their items grouped by Kind (e.g. "Node").
+    If the combined query fails (for instance because one of the CRDs is not
+    installed), each kind is fetched on its own and kinds that still fail are
+    left out of the result. Raises subprocess.CalledProcessError only if no
+    kind could be fetched.
+    """
+    command = ["oc", "get", ",".join(kinds), "-A", "-o", "json"]
+    try:
+        raw = cached_oc_output(",".join(kinds), command, ttl)
+    except subprocess.CalledProcessError as e:
+        if len(kinds) == 1:
+            raise
+        error = e
+    else:
+        grouped = {}
+        for item in _json.loads(raw).get("items", []):
+            grouped.setdefault(item.get("kind"), []).append(item)
+        return grouped
+
+    grouped = {}
+    fetched = False
+    for kind in kinds:
+        try:
+            grouped.update(fetch_many([kind], ttl))
+            fetched = True
+        except subprocess.CalledProcessError as e:
+            error = e
+    if not fetched:
+        raise error
+    return grouped